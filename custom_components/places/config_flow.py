@@ -30,6 +30,7 @@ from .const import (
     CONF_MAP_ZOOM,
     CONF_SHOW_TIME,
     CONF_USE_GPS,
+    CONF_USE_OSM_CACHE,
     DEFAULT_DATE_FORMAT,
     DEFAULT_DISPLAY_OPTIONS,
     DEFAULT_EXTENDED_ATTR,
@@ -38,6 +39,7 @@ from .const import (
     DEFAULT_MAP_ZOOM,
     DEFAULT_SHOW_TIME,
     DEFAULT_USE_GPS,
+    DEFAULT_USE_OSM_CACHE,
     DOMAIN,
     HOME_LOCATION_DOMAINS,
     TRACKING_DOMAINS,
@@ -234,6 +236,9 @@ class PlacesConfigFlow(ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_USE_GPS, default=DEFAULT_USE_GPS): selector.BooleanSelector(
                     selector.BooleanSelectorConfig()
                 ),
+                vol.Optional(
+                    CONF_USE_OSM_CACHE, default=DEFAULT_USE_OSM_CACHE
+                ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
                 vol.Optional(
                     CONF_EXTENDED_ATTR, default=DEFAULT_EXTENDED_ATTR
                 ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
@@ -392,6 +397,10 @@ class PlacesOptionsFlowHandler(OptionsFlow):
                     CONF_USE_GPS,
                     default=(self.config_entry.data.get(CONF_USE_GPS, DEFAULT_USE_GPS)),
                 ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
+                vol.Optional(
+                    CONF_USE_OSM_CACHE,
+                    default=(self.config_entry.data.get(CONF_USE_OSM_CACHE, DEFAULT_USE_OSM_CACHE)),
+                ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
                 vol.Optional(
                     CONF_EXTENDED_ATTR,
                     default=(self.config_entry.data.get(CONF_EXTENDED_ATTR, DEFAULT_EXTENDED_ATTR)),
@@ -28,6 +28,7 @@ DEFAULT_DISPLAY_OPTIONS = "zone_name, place"
 DEFAULT_SHOW_TIME = False
 DEFAULT_DATE_FORMAT = "mm/dd"
 DEFAULT_USE_GPS = True
+DEFAULT_USE_OSM_CACHE = True
 
 # Settings
 
@@ -43,6 +44,18 @@ TRACKING_DOMAINS_NEED_LATLONG: list[str] = [
     "variable",
 ]
 HOME_LOCATION_DOMAINS: list[str] = [CONF_ZONE]
+MAP_LINK_URLS: MutableMapping[str, str] = {
+    "apple": "https://maps.apple.com/maps/?q={location}&z={zoom}",
+    "google": "https://maps.google.com/?q={location}&ll={location}&z={zoom}",
+    "osm": (
+        "https://www.openstreetmap.org/?mlat={latitude}&mlon={longitude}"
+        "#map={zoom}/{latitude_short}/{longitude_short}"
+    ),
+}
+OSM_REVERSE_URL = "https://nominatim.openstreetmap.org/reverse"
+OSM_DETAILS_URL = "https://nominatim.openstreetmap.org/lookup"
+WIKIDATA_ENTITY_URL = "https://www.wikidata.org/wiki/Special:EntityData/{wikidata_id}.json"
+OSM_TYPE_ABBR: MutableMapping[str, str] = {"node": "N", "way": "W", "relation": "R"}
 
 # Config
 CONF_DEVICETRACKER_ID = "devicetracker_id"
@@ -56,6 +69,7 @@ CONF_DISPLAY_OPTIONS = "options"
 CONF_SHOW_TIME = "show_time"
 CONF_DATE_FORMAT = "date_format"
 CONF_USE_GPS = "use_gps_accuracy"
+CONF_USE_OSM_CACHE = "use_osm_cache"
 
 # Attributes
 ATTR_ATTRIBUTES = "attributes"
@@ -133,6 +147,7 @@ CONFIG_ATTRIBUTES_LIST: list[str] = [
     CONF_SHOW_TIME,
     CONF_DATE_FORMAT,
     CONF_USE_GPS,
+    CONF_USE_OSM_CACHE,
     CONF_UNIQUE_ID,
 ]
 RESET_ATTRIBUTE_LIST: list[str] = [
@@ -310,6 +325,35 @@ PLACE_NAME_DUPLICATE_LIST: list[str] = [
     ATTR_DEVICETRACKER_ZONE_NAME,
 ]
 
+# OSM address keys in order of preference
+CITY_TYPES: tuple[str, ...] = (
+    "city",
+    "town",
+    "village",
+    "township",
+    "hamlet",
+    "city_district",
+    "municipality",
+)
+POSTAL_TOWN_TYPES: tuple[str, ...] = (
+    "city",
+    "town",
+    "village",
+    "township",
+    "hamlet",
+    "borough",
+    "suburb",
+)
+NEIGHBOURHOOD_TYPES: tuple[str, ...] = (
+    "village",
+    "township",
+    "hamlet",
+    "borough",
+    "suburb",
+    "quarter",
+    "neighbourhood",
+)
+
 DISPLAY_OPTIONS_MAP: MutableMapping[str, str] = {
     "driving": ATTR_DRIVING,
     "place_name": ATTR_PLACE_NAME,
@@ -347,3 +391,26 @@ DISPLAY_OPTIONS_MAP: MutableMapping[str, str] = {
     "zone": ATTR_DEVICETRACKER_ZONE,
     "zone_name": ATTR_DEVICETRACKER_ZONE_NAME,
 }
+
+# Display options shown after the place and street, in display order
+DISPLAY_OPTIONS_LOCATION_DETAILS: tuple[tuple[str, str], ...] = (
+    ("city", ATTR_CITY),
+    ("county", ATTR_COUNTY),
+    ("state", ATTR_REGION),
+    ("region", ATTR_REGION),
+    ("postal_code", ATTR_POSTAL_CODE),
+    ("country", ATTR_COUNTRY),
+    ("formatted_address", ATTR_FORMATTED_ADDRESS),
+)
+
+# Tracker zone states that never count as being in a zone
+NOT_IN_ZONE_STATES: frozenset[str] = frozenset({"away", "not_home", "notset", "not_set"})
+NOT_IN_ZONE_PREFIXES: tuple[str, ...] = ("statzon", "ic3_statzone_")
+
+# OpenStreetMap address keys copied straight into attributes
+OSM_ADDRESS_ATTRIBUTES: tuple[tuple[str, str], ...] = (
+    ("state", ATTR_REGION),
+    ("county", ATTR_COUNTY),
+    ("country", ATTR_COUNTRY),
+    ("postcode", ATTR_POSTAL_CODE),
+)
@@ -11,20 +11,22 @@ Description:
 GitHub: https://github.com/custom-components/places
 """
 
-from collections.abc import MutableMapping
-import contextlib
-import copy
+import asyncio
+from collections.abc import Iterator, MutableMapping
+from contextlib import suppress
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import json
 import locale
 import logging
 from pathlib import Path
+import random
 import re
+import time
 from typing import Any
+from urllib.parse import urlencode
 from zoneinfo import ZoneInfo
 
-import requests
-from urllib3.exceptions import NewConnectionError
+import aiohttp
 
 from homeassistant.components.recorder import DATA_INSTANCE as RECORDER_INSTANCE
 from homeassistant.components.sensor import SensorEntity
@@ -41,23 +43,30 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_UNIQUE_ID,
     CONF_ZONE,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     MATCH_ALL,
+    MAX_LENGTH_STATE_STATE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import homeassistant.helpers.entity_registry as er
-from homeassistant.helpers.event import EventStateChangedData, async_track_state_change_event
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_call_later,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util import Throttle, slugify
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads, json_loads_object
 from homeassistant.util.location import distance
 
 from .const import (
-    ATTR_ATTRIBUTES,
     ATTR_CITY,
     ATTR_CITY_CLEAN,
-    ATTR_COUNTRY,
     ATTR_COUNTRY_CODE,
     ATTR_COUNTY,
     ATTR_DEVICETRACKER_ID,
@@ -100,10 +109,8 @@ from .const import (
     ATTR_PLACE_NAME_NO_DUPE,
     ATTR_PLACE_NEIGHBOURHOOD,
     ATTR_PLACE_TYPE,
-    ATTR_POSTAL_CODE,
     ATTR_POSTAL_TOWN,
     ATTR_PREVIOUS_STATE,
-    ATTR_REGION,
     ATTR_SHOW_DATE,
     ATTR_STATE_ABBR,
     ATTR_STREET,
@@ -111,6 +118,7 @@ from .const import (
     ATTR_STREET_REF,
     ATTR_WIKIDATA_DICT,
     ATTR_WIKIDATA_ID,
+    CITY_TYPES,
     CONF_DATE_FORMAT,
     CONF_DEVICETRACKER_ID,
     CONF_DISPLAY_OPTIONS,
@@ -121,6 +129,7 @@ from .const import (
     CONF_MAP_ZOOM,
     CONF_SHOW_TIME,
     CONF_USE_GPS,
+    CONF_USE_OSM_CACHE,
     CONFIG_ATTRIBUTES_LIST,
     DEFAULT_DATE_FORMAT,
     DEFAULT_DISPLAY_OPTIONS,
@@ -131,6 +140,8 @@ from .const import (
     DEFAULT_MAP_ZOOM,
     DEFAULT_SHOW_TIME,
     DEFAULT_USE_GPS,
+    DEFAULT_USE_OSM_CACHE,
+    DISPLAY_OPTIONS_LOCATION_DETAILS,
     DISPLAY_OPTIONS_MAP,
     DOMAIN,
     ENTITY_ID_FORMAT,
@@ -140,16 +151,48 @@ from .const import (
     EXTRA_STATE_ATTRIBUTE_LIST,
     JSON_ATTRIBUTE_LIST,
     JSON_IGNORE_ATTRIBUTE_LIST,
+    MAP_LINK_URLS,
+    NEIGHBOURHOOD_TYPES,
+    NOT_IN_ZONE_PREFIXES,
+    NOT_IN_ZONE_STATES,
+    OSM_ADDRESS_ATTRIBUTES,
+    OSM_DETAILS_URL,
+    OSM_REVERSE_URL,
+    OSM_TYPE_ABBR,
     PLACE_NAME_DUPLICATE_LIST,
     PLATFORM,
+    POSTAL_TOWN_TYPES,
     RESET_ATTRIBUTE_LIST,
     VERSION,
+    WIKIDATA_ENTITY_URL,
 )
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 THROTTLE_INTERVAL = timedelta(seconds=600)
-MIN_THROTTLE_INTERVAL = timedelta(seconds=10)
+MIN_THROTTLE_INTERVAL = 10  # seconds
 SCAN_INTERVAL = timedelta(seconds=30)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+REQUEST_HEADERS: dict[str, str] = {"user-agent": f"Mozilla/5.0 (Home Assistant) {DOMAIN}/{VERSION}"}
+REQUEST_MAX_RETRIES = 3
+REQUEST_RETRY_BASE = 0.5
+REQUEST_RETRY_CAP = 8.0
+STREET_REF_SPLIT_RE = re.compile(r"[;\\/,.:]")
+DIGIT_RE = re.compile(r"\d")
+ADV_OPTIONS_RE = re.compile(r"[()\[\]]")
+ADV_OPTIONS_DELIM_RE = re.compile(r"[,\[(]")
+SINCE_SUFFIX_RE = re.compile(r" \(since \d\d[:/]\d\d\)")
+OSM_CACHE_SIZE = 128
+OSM_CACHE_TTL = 3600  # seconds
+OSM_CACHE_PRECISION = 4  # decimal places, about 11 m
+METERS_PER_MILE = 1609.344
+JSON_WRITE_DELAY = 2  # seconds
+UNKNOWN_STATES: frozenset[str] = frozenset({"none", STATE_UNKNOWN, STATE_UNAVAILABLE})
+JSON_ATTRIBUTES: frozenset[str] = frozenset(JSON_ATTRIBUTE_LIST)
+JSON_NOT_IMPORTED_ATTRIBUTES: frozenset[str] = frozenset(
+    CONFIG_ATTRIBUTES_LIST + JSON_IGNORE_ATTRIBUTE_LIST
+)
+# JSON folders already created by this process, so reloads skip the executor job
+_created_json_folders: set[str] = set()
 
 
 async def async_setup_entry(
@@ -164,7 +207,8 @@ async def async_setup_entry(
     unique_id: str = config_entry.entry_id
     name: str = config[CONF_NAME]
     json_folder: str = hass.config.path("custom_components", DOMAIN, "json_sensors")
-    await hass.async_add_executor_job(_create_json_folder, json_folder)
+    if json_folder not in _created_json_folders:
+        await hass.async_add_executor_job(_create_json_folder, json_folder)
     filename: str = f"{DOMAIN}-{slugify(unique_id)}.json"
     imported_attributes: MutableMapping[str, Any] = await hass.async_add_executor_job(
         _get_dict_from_json_file, name, filename, json_folder
@@ -207,6 +251,7 @@ async def async_setup_entry(
 def _create_json_folder(json_folder: str) -> None:
     try:
         Path(json_folder).mkdir(parents=True, exist_ok=True)
+        _created_json_folders.add(json_folder)
     except OSError as e:
         _LOGGER.warning(
             "OSError creating folder for JSON sensor files: %s: %s", e.__class__.__qualname__, e
@@ -216,11 +261,9 @@ def _create_json_folder(json_folder: str) -> None:
 def _get_dict_from_json_file(
     name: str, filename: str, json_folder: str
 ) -> MutableMapping[str, Any]:
-    sensor_attributes: MutableMapping[str, Any] = {}
     try:
         json_file_path: Path = Path(json_folder) / filename
-        with json_file_path.open() as jsonfile:
-            sensor_attributes = json.load(jsonfile)
+        sensor_attributes = json_loads_object(json_file_path.read_bytes())
     except OSError as e:
         _LOGGER.debug(
             "(%s) [Init] No JSON file to import (%s): %s: %s",
@@ -230,12 +273,23 @@ def _get_dict_from_json_file(
             e,
         )
         return {}
-    return sensor_attributes
+    except ValueError as e:
+        _LOGGER.warning(
+            "(%s) [Init] Unable to read JSON file (%s): %s: %s",
+            name,
+            filename,
+            e.__class__.__qualname__,
+            e,
+        )
+        return {}
+    return dict(sensor_attributes)
 
 
 def _remove_json_file(name: str, filename: str, json_folder: str) -> None:
     try:
         json_file_path: Path = Path(json_folder) / filename
+        # Also remove a temp file left behind by a failed write
+        json_file_path.with_name(f"{filename}.tmp").unlink(missing_ok=True)
         json_file_path.unlink()
     except OSError as e:
         _LOGGER.debug(
@@ -250,6 +304,9 @@ def _remove_json_file(name: str, filename: str, json_folder: str) -> None:
 
 
 def _is_float(value: Any) -> bool:
+    # Trackers and zones normally report coordinates as numbers already
+    if isinstance(value, float | int):
+        return True
     if value is not None:
         try:
             float(value)
@@ -260,6 +317,19 @@ def _is_float(value: Any) -> bool:
     return False
 
 
+@dataclass(frozen=True)
+class AdvancedOption:
+    """A single parsed advanced display option."""
+
+    opt: str
+    incl: list[str] = field(default_factory=list)
+    excl: list[str] = field(default_factory=list)
+    incl_attr: MutableMapping[str, Any] = field(default_factory=dict)
+    excl_attr: MutableMapping[str, Any] = field(default_factory=dict)
+    # Options to use instead when this option has no state
+    fallback: tuple["AdvancedOption", ...] = ()
+
+
 class Places(SensorEntity):
     """Representation of a Places Sensor."""
 
@@ -287,6 +357,22 @@ class Places(SensorEntity):
         self._config: MutableMapping[str, Any] = config
         self._config_entry: ConfigEntry = config_entry
         self._hass: HomeAssistant = hass
+        self._session: aiohttp.ClientSession = async_get_clientsession(hass)
+        # (devicetracker_zone, in zone) for the current update
+        self._in_zone_cache: tuple[Any, bool] | None = None
+        self._time_zone: ZoneInfo | None = None
+        self._last_changed_cache: tuple[str, datetime] | None = None
+        self._last_tsc_update: float | None = None
+        self._json_attributes: MutableMapping[str, Any] = {}
+        self._cancel_json_write: CALLBACK_TYPE | None = None
+        # Held while the JSON file is written or removed, so only one runs at a time
+        self._json_write_lock: asyncio.Lock = asyncio.Lock()
+        self._json_file_removed: bool = False
+        self._json_written: bytes | None = None
+        # Parsed advanced display options, keyed on the options string
+        self._adv_options_cache: tuple[str, tuple[AdvancedOption, ...]] | None = None
+        # (rounded latitude, rounded longitude) -> (time fetched, OSM dict), oldest first
+        self._osm_cache: dict[tuple[float, float], tuple[float, MutableMapping[str, Any]]] = {}
         self._set_attr(CONF_NAME, name)
         self._attr_name: str = name
         self._set_attr(CONF_UNIQUE_ID, unique_id)
@@ -319,6 +405,7 @@ class Places(SensorEntity):
         # Consider reconciling this in the future
         self._set_attr(ATTR_DEVICETRACKER_ID, config[CONF_DEVICETRACKER_ID].lower())
         self._set_attr(CONF_HOME_ZONE, config.setdefault(CONF_HOME_ZONE, DEFAULT_HOME_ZONE).lower())
+        self._home_zone_name: str = self._get_attr_safe_str(CONF_HOME_ZONE).split(".", 1)[-1]
         self._set_attr(
             CONF_MAP_PROVIDER,
             config.setdefault(CONF_MAP_PROVIDER, DEFAULT_MAP_PROVIDER).lower(),
@@ -331,6 +418,17 @@ class Places(SensorEntity):
                 CONF_LANGUAGE,
                 self._get_attr_safe_str(CONF_LANGUAGE).replace(" ", "").strip(),
             )
+        self._osm_reverse_params: MutableMapping[str, Any] = {
+            "format": "json",
+            "addressdetails": 1,
+            "namedetails": 1,
+            "zoom": 18,
+            "limit": 1,
+        }
+        if not self._is_attr_blank(CONF_LANGUAGE):
+            self._osm_reverse_params["accept-language"] = self._get_attr(CONF_LANGUAGE)
+        if not self._is_attr_blank(CONF_API_KEY):
+            self._osm_reverse_params["email"] = self._get_attr(CONF_API_KEY)
         self._set_attr(
             CONF_EXTENDED_ATTR,
             config.setdefault(CONF_EXTENDED_ATTR, DEFAULT_EXTENDED_ATTR),
@@ -341,10 +439,19 @@ class Places(SensorEntity):
             config.setdefault(CONF_DATE_FORMAT, DEFAULT_DATE_FORMAT).lower(),
         )
         self._set_attr(CONF_USE_GPS, config.setdefault(CONF_USE_GPS, DEFAULT_USE_GPS))
+        self._set_attr(
+            CONF_USE_OSM_CACHE, config.setdefault(CONF_USE_OSM_CACHE, DEFAULT_USE_OSM_CACHE)
+        )
         self._set_attr(
             ATTR_JSON_FILENAME,
             f"{DOMAIN}-{slugify(str(self._get_attr(CONF_UNIQUE_ID)))}.json",
         )
+        self._json_file_path: Path = Path(self._json_folder) / self._get_attr_safe_str(
+            ATTR_JSON_FILENAME
+        )
+        self._json_tmp_file_path: Path = self._json_file_path.with_name(
+            f"{self._json_file_path.name}.tmp"
+        )
         self._set_attr(ATTR_DISPLAY_OPTIONS, self._get_attr(CONF_DISPLAY_OPTIONS))
         _LOGGER.debug(
             "(%s) [Init] JSON Filename: %s",
@@ -355,31 +462,27 @@ class Places(SensorEntity):
         self._attr_native_value = None  # Represents the state in SensorEntity
         self._clear_attr(ATTR_NATIVE_VALUE)
 
-        if (
-            not self._is_attr_blank(CONF_HOME_ZONE)
-            and CONF_LATITUDE in hass.states.get(self._get_attr(CONF_HOME_ZONE)).attributes
-            and hass.states.get(self._get_attr(CONF_HOME_ZONE)).attributes.get(CONF_LATITUDE)
-            is not None
-            and _is_float(
-                hass.states.get(self._get_attr(CONF_HOME_ZONE)).attributes.get(CONF_LATITUDE)
-            )
-        ):
-            self._set_attr(
-                ATTR_HOME_LATITUDE,
-                str(hass.states.get(self._get_attr(CONF_HOME_ZONE)).attributes.get(CONF_LATITUDE)),
-            )
-        if (
-            not self._is_attr_blank(CONF_HOME_ZONE)
-            and CONF_LONGITUDE in hass.states.get(self._get_attr(CONF_HOME_ZONE)).attributes
-            and hass.states.get(self._get_attr(CONF_HOME_ZONE)).attributes.get(CONF_LONGITUDE)
-            is not None
-            and _is_float(
-                hass.states.get(self._get_attr(CONF_HOME_ZONE)).attributes.get(CONF_LONGITUDE)
-            )
+        home_zone_state = (
+            None
+            if self._is_attr_blank(CONF_HOME_ZONE)
+            else hass.states.get(self._get_attr(CONF_HOME_ZONE))
+        )
+        if home_zone_state is not None:
+            home_latitude: Any = home_zone_state.attributes.get(CONF_LATITUDE)
+            home_longitude: Any = home_zone_state.attributes.get(CONF_LONGITUDE)
+            if home_latitude is not None and _is_float(home_latitude):
+                self._set_attr(ATTR_HOME_LATITUDE, str(home_latitude))
+            if home_longitude is not None and _is_float(home_longitude):
+                self._set_attr(ATTR_HOME_LONGITUDE, str(home_longitude))
+
+        # The home coordinates are only set here, so parse them once for the distance math
+        self._home_coordinates: tuple[float, float] | None = None
+        if not self._is_attr_blank(ATTR_HOME_LATITUDE) and not self._is_attr_blank(
+            ATTR_HOME_LONGITUDE
         ):
-            self._set_attr(
-                ATTR_HOME_LONGITUDE,
-                str(hass.states.get(self._get_attr(CONF_HOME_ZONE)).attributes.get(CONF_LONGITUDE)),
+            self._home_coordinates = (
+                float(self._get_attr_safe_str(ATTR_HOME_LATITUDE)),
+                float(self._get_attr_safe_str(ATTR_HOME_LONGITUDE)),
             )
 
         self._attr_entity_picture = (
@@ -402,7 +505,6 @@ class Places(SensorEntity):
             _LOGGER.debug(
                 "(%s) [Init] Sensor Attributes Imported from JSON file", self._get_attr(CONF_NAME)
             )
-        self._cleanup_attributes()
         if self._get_attr(CONF_EXTENDED_ATTR):
             self._exclude_event_types()
         _LOGGER.info(
@@ -431,6 +533,11 @@ class Places(SensorEntity):
                 self._async_tsc_update,
             )
         )
+        self.async_on_remove(
+            self._hass.bus.async_listen(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_flush_sensor_json
+            )
+        )
         _LOGGER.debug(
             "(%s) [Init] Subscribed to Tracked Entity state change events",
             self._get_attr(CONF_NAME),
@@ -439,12 +546,18 @@ class Places(SensorEntity):
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
 
-        await self._hass.async_add_executor_job(
-            _remove_json_file,
-            self._get_attr(CONF_NAME),
-            self._get_attr(ATTR_JSON_FILENAME),
-            self._json_folder,
-        )
+        if self._cancel_json_write is not None:
+            self._cancel_json_write()
+            self._cancel_json_write = None
+        self._json_file_removed = True
+        # Wait for a write already in the executor so it cannot recreate the file
+        async with self._json_write_lock:
+            await self._hass.async_add_executor_job(
+                _remove_json_file,
+                self._get_attr(CONF_NAME),
+                self._get_attr(ATTR_JSON_FILENAME),
+                self._json_folder,
+            )
 
         if RECORDER_INSTANCE in self._hass.data and self._get_attr(CONF_EXTENDED_ATTR):
             _LOGGER.debug(
@@ -468,16 +581,19 @@ class Places(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        return_attr: dict[str, Any] = {}
-        self._cleanup_attributes()
-        for attr in EXTRA_STATE_ATTRIBUTE_LIST:
-            if self._get_attr(attr):
-                return_attr.update({attr: self._get_attr(attr)})
-
-        if self._get_attr(CONF_EXTENDED_ATTR):
-            for attr in EXTENDED_ATTRIBUTE_LIST:
-                if self._get_attr(attr):
-                    return_attr.update({attr: self._get_attr(attr)})
+        internal_attr: MutableMapping[str, Any] = self._internal_attr
+        return_attr: dict[str, Any] = {
+            attr: value for attr in EXTRA_STATE_ATTRIBUTE_LIST if (value := internal_attr.get(attr))
+        }
+
+        if internal_attr.get(CONF_EXTENDED_ATTR):
+            return_attr.update(
+                {
+                    attr: value
+                    for attr in EXTENDED_ATTRIBUTE_LIST
+                    if (value := internal_attr.get(attr))
+                }
+            )
         # _LOGGER.debug("(%s) Extra State Attributes: %s", self._get_attr(CONF_NAME), return_attr)
         return return_attr
 
@@ -485,16 +601,15 @@ class Places(SensorEntity):
         """Import the JSON state attributes. Takes a Dictionary as input."""
 
         self._set_attr(ATTR_INITIAL_UPDATE, False)
-        for attr in JSON_ATTRIBUTE_LIST:
-            if attr in json_attr:
-                self._set_attr(attr, json_attr.pop(attr, None))
+        for attr in list(json_attr):
+            if attr in JSON_ATTRIBUTES:
+                self._set_attr(attr, json_attr.pop(attr))
+            elif attr in JSON_NOT_IMPORTED_ATTRIBUTES:
+                # Part of the Config or explicitly not imported from JSON
+                json_attr.pop(attr)
         if not self._is_attr_blank(ATTR_NATIVE_VALUE):
             self._attr_native_value = self._get_attr(ATTR_NATIVE_VALUE)
 
-        # Remove attributes that are part of the Config and are explicitly not imported from JSON
-        for attr in CONFIG_ATTRIBUTES_LIST + JSON_IGNORE_ATTRIBUTE_LIST:
-            if attr in json_attr:
-                json_attr.pop(attr, None)
         if json_attr is not None and json_attr:
             _LOGGER.debug(
                 "(%s) [import_attributes] Attributes not imported: %s",
@@ -502,20 +617,17 @@ class Places(SensorEntity):
                 json_attr,
             )
 
-    def _cleanup_attributes(self) -> None:
-        for attr in list(self._internal_attr):
-            if self._is_attr_blank(attr):
-                self._clear_attr(attr)
-
     def _is_attr_blank(self, attr: str) -> bool:
-        if self._internal_attr.get(attr) or self._internal_attr.get(attr) == 0:
-            return False
-        return True
+        value: Any = self._internal_attr.get(attr)
+        return not value and value != 0
 
     def _get_attr(self, attr: str | None, default: Any | None = None) -> None | Any:
-        if attr is None or (default is None and self._is_attr_blank(attr)):
+        if attr is None:
             return None
-        return self._internal_attr.get(attr, default)
+        value: Any = self._internal_attr.get(attr, default)
+        if default is None and not value and value != 0:
+            return None
+        return value
 
     def _get_attr_safe_str(self, attr: str | None, default: Any | None = None) -> str:
         value: None | Any = self._get_attr(attr=attr, default=default)
@@ -545,33 +657,36 @@ class Places(SensorEntity):
         return value
 
     def _set_attr(self, attr: str, value: Any | None = None) -> None:
-        if attr:
-            self._internal_attr.update({attr: value})
+        if not attr:
+            return
+        # Blank values are not stored, so the attributes never need a cleanup pass
+        if not value and value != 0:
+            self._internal_attr.pop(attr, None)
+        else:
+            self._internal_attr[attr] = value
 
     def _clear_attr(self, attr: str) -> None:
         self._internal_attr.pop(attr, None)
 
     async def _async_is_devicetracker_set(self) -> int:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         proceed_with_update = 0
         # 0: False. 1: True. 2: False, but set direction of travel to stationary
 
-        if (
-            self._is_attr_blank(CONF_DEVICETRACKER_ID)
-            or self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)) is None
-            or (
-                isinstance(
-                    self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)),
-                    str,
-                )
-                and self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).lower()
-                in {"none", STATE_UNKNOWN, STATE_UNAVAILABLE}
-            )
+        devicetracker_state = (
+            None
+            if self._is_attr_blank(CONF_DEVICETRACKER_ID)
+            else self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID))
+        )
+        if devicetracker_state is None or (
+            isinstance(devicetracker_state.state, str)
+            and devicetracker_state.state.lower() in UNKNOWN_STATES
         ):
             if self._warn_if_device_tracker_prob or self._get_attr(ATTR_INITIAL_UPDATE):
                 _LOGGER.warning(
                     "(%s) Tracked Entity (%s) "
                     "is not set or is not available. Not Proceeding with Update",
-                    self._get_attr(CONF_NAME),
+                    sensor_name,
                     self._get_attr(CONF_DEVICETRACKER_ID),
                 )
                 self._warn_if_device_tracker_prob = False
@@ -579,38 +694,18 @@ class Places(SensorEntity):
                 _LOGGER.info(
                     "(%s) Tracked Entity (%s) "
                     "is not set or is not available. Not Proceeding with Update",
-                    self._get_attr(CONF_NAME),
+                    sensor_name,
                     self._get_attr(CONF_DEVICETRACKER_ID),
                 )
             return 0
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
+        latitude: Any = devicetracker_state.attributes.get(CONF_LATITUDE)
+        longitude: Any = devicetracker_state.attributes.get(CONF_LONGITUDE)
         if (
-            hasattr(
-                self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)),
-                ATTR_ATTRIBUTES,
-            )
-            and CONF_LATITUDE
-            in self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes
-            and CONF_LONGITUDE
-            in self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes
-            and self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                CONF_LATITUDE
-            )
-            is not None
-            and self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                CONF_LONGITUDE
-            )
-            is not None
-            and _is_float(
-                self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                    CONF_LATITUDE
-                )
-            )
-            and _is_float(
-                self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                    CONF_LONGITUDE
-                )
-            )
+            latitude is not None
+            and longitude is not None
+            and _is_float(latitude)
+            and _is_float(longitude)
         ):
             self._warn_if_device_tracker_prob = True
             proceed_with_update = 1
@@ -620,7 +715,7 @@ class Places(SensorEntity):
                 _LOGGER.warning(
                     "(%s) Tracked Entity (%s) "
                     "Latitude/Longitude is not set or is not a number. Not Proceeding with Update.",
-                    self._get_attr(CONF_NAME),
+                    sensor_name,
                     self._get_attr(CONF_DEVICETRACKER_ID),
                 )
                 self._warn_if_device_tracker_prob = False
@@ -628,12 +723,12 @@ class Places(SensorEntity):
                 _LOGGER.info(
                     "(%s) Tracked Entity (%s) "
                     "Latitude/Longitude is not set or is not a number. Not Proceeding with Update.",
-                    self._get_attr(CONF_NAME),
+                    sensor_name,
                     self._get_attr(CONF_DEVICETRACKER_ID),
                 )
             _LOGGER.debug(
                 "(%s) Tracked Entity (%s) details: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 self._get_attr(CONF_DEVICETRACKER_ID),
                 self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)),
             )
@@ -641,15 +736,21 @@ class Places(SensorEntity):
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
         return proceed_with_update
 
-    @Throttle(MIN_THROTTLE_INTERVAL)
     @callback
     def _async_tsc_update(self, event: Event[EventStateChangedData]) -> None:
         """Call the _async_do_update function based on the TSC (track state change) event."""
+        # Runs on the event loop, so a plain timestamp is enough to throttle it
+        now: float = time.monotonic()
+        if (
+            self._last_tsc_update is not None
+            and now - self._last_tsc_update < MIN_THROTTLE_INTERVAL
+        ):
+            return
+        self._last_tsc_update = now
         # _LOGGER.debug(f"({self._get_attr(CONF_NAME)}) [TSC Update] event: {event}")
         new_state = event.data["new_state"]
         if new_state is None or (
-            isinstance(new_state.state, str)
-            and new_state.state.lower() in {"none", STATE_UNKNOWN, STATE_UNAVAILABLE}
+            isinstance(new_state.state, str) and new_state.state.lower() in UNKNOWN_STATES
         ):
             return
         # _LOGGER.debug("(%s) [TSC Update] new_state: %s", self._get_attr(CONF_NAME), new_state)
@@ -664,83 +765,76 @@ class Places(SensorEntity):
         self._hass.async_create_task(self._async_do_update(update_type))
 
     @staticmethod
-    async def _async_clear_since_from_state(orig_state: str) -> str:
-        return re.sub(r" \(since \d\d[:/]\d\d\)", "", orig_state)
+    def _clear_since_from_state(orig_state: str) -> str:
+        if " (since " not in orig_state:
+            return orig_state
+        return SINCE_SUFFIX_RE.sub("", orig_state)
 
     async def _async_in_zone(self) -> bool:
-        if not self._is_attr_blank(ATTR_DEVICETRACKER_ZONE):
-            zone: str = self._get_attr_safe_str(ATTR_DEVICETRACKER_ZONE).lower()
-            zone_state = self._hass.states.get(f"{CONF_ZONE}.{zone}")
-            if (
-                self._get_attr_safe_str(CONF_DEVICETRACKER_ID).split(".")[0] == CONF_ZONE
-                or (
-                    "stationary" in zone
-                    or zone.startswith(("statzon", "ic3_statzone_"))
-                    or zone in {"away", "not_home", "notset", "not_set"}
-                )
-                or (
-                    zone_state is not None
-                    and zone_state.attributes.get(ATTR_PASSIVE, False) is True
-                )
+        # Cached per update, keyed on the zone since it is set partway through the update
+        devicetracker_zone: Any = self._get_attr(ATTR_DEVICETRACKER_ZONE)
+        if self._in_zone_cache is not None and self._in_zone_cache[0] == devicetracker_zone:
+            return self._in_zone_cache[1]
+        in_zone: bool = False
+        if (
+            devicetracker_zone is not None
+            and self._get_attr_safe_str(CONF_DEVICETRACKER_ID).split(".")[0] != CONF_ZONE
+        ):
+            zone: str = str(devicetracker_zone).lower()
+            if not (
+                "stationary" in zone
+                or zone in NOT_IN_ZONE_STATES
+                or zone.startswith(NOT_IN_ZONE_PREFIXES)
             ):
-                return False
-            return True
-        return False
-
-    async def _async_cleanup_attributes(self) -> None:
-        attrs: MutableMapping[str, Any] = copy.deepcopy(self._internal_attr)
-        for attr in attrs:
-            if self._is_attr_blank(attr):
-                self._clear_attr(attr)
+                # Only look up the zone entity once the cheap string checks have passed
+                zone_state = self._hass.states.get(f"{CONF_ZONE}.{zone}")
+                in_zone = (
+                    zone_state is None or zone_state.attributes.get(ATTR_PASSIVE, False) is not True
+                )
+        self._in_zone_cache = (devicetracker_zone, in_zone)
+        return in_zone
 
     async def _async_check_for_updated_entity_name(self) -> None:
-        if hasattr(self, "entity_id") and self._entity_id is not None:
-            # _LOGGER.debug("(%s) Entity ID: %s", self._get_attr(CONF_NAME), self._entity_id)
-            if (
-                self._hass.states.get(str(self._entity_id)) is not None
-                and self._hass.states.get(str(self._entity_id)).attributes.get(ATTR_FRIENDLY_NAME)
-                is not None
-                and self._get_attr(CONF_NAME)
-                != self._hass.states.get(str(self._entity_id)).attributes.get(ATTR_FRIENDLY_NAME)
-            ):
-                _LOGGER.debug(
-                    "(%s) Sensor Name Changed. Updating Name to: %s",
-                    self._get_attr(CONF_NAME),
-                    self._hass.states.get(str(self._entity_id)).attributes.get(ATTR_FRIENDLY_NAME),
-                )
-                self._set_attr(
-                    CONF_NAME,
-                    self._hass.states.get(str(self._entity_id)).attributes.get(ATTR_FRIENDLY_NAME),
-                )
-                self._config.update({CONF_NAME: self._get_attr(CONF_NAME)})
-                self._set_attr(CONF_NAME, self._get_attr(CONF_NAME))
-                _LOGGER.debug(
-                    "(%s) Updated Config Name: %s",
-                    self._get_attr(CONF_NAME),
-                    self._config.get(CONF_NAME),
-                )
-                self._hass.config_entries.async_update_entry(
-                    self._config_entry,
-                    data=self._config,
-                    options=self._config_entry.options,
-                )
-                _LOGGER.debug(
-                    "(%s) Updated ConfigEntry Name: %s",
-                    self._get_attr(CONF_NAME),
-                    self._config_entry.data.get(CONF_NAME),
-                )
+        if not hasattr(self, "entity_id") or self._entity_id is None:
+            return
+        # _LOGGER.debug("(%s) Entity ID: %s", self._get_attr(CONF_NAME), self._entity_id)
+        entity_state = self._hass.states.get(str(self._entity_id))
+        if entity_state is None:
+            return
+        friendly_name: Any = entity_state.attributes.get(ATTR_FRIENDLY_NAME)
+        # The name rarely changes, so only touch the config entry when it has
+        if friendly_name is None or friendly_name == self._get_attr(CONF_NAME):
+            return
+        _LOGGER.debug(
+            "(%s) Sensor Name Changed. Updating Name to: %s",
+            self._get_attr(CONF_NAME),
+            friendly_name,
+        )
+        self._set_attr(CONF_NAME, friendly_name)
+        self._config[CONF_NAME] = friendly_name
+        _LOGGER.debug(
+            "(%s) Updated Config Name: %s",
+            self._get_attr(CONF_NAME),
+            self._config.get(CONF_NAME),
+        )
+        self._hass.config_entries.async_update_entry(
+            self._config_entry,
+            data=self._config,
+            options=self._config_entry.options,
+        )
+        _LOGGER.debug(
+            "(%s) Updated ConfigEntry Name: %s",
+            self._get_attr(CONF_NAME),
+            self._config_entry.data.get(CONF_NAME),
+        )
 
     async def _async_get_zone_details(self) -> None:
+        devicetracker_state = self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID))
         if self._get_attr_safe_str(CONF_DEVICETRACKER_ID).split(".")[0] != CONF_ZONE:
-            self._set_attr(
-                ATTR_DEVICETRACKER_ZONE,
-                self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).state,
-            )
+            self._set_attr(ATTR_DEVICETRACKER_ZONE, devicetracker_state.state)
         if await self._async_in_zone():
             devicetracker_zone_name_state = None
-            devicetracker_zone_id: str | None = self._hass.states.get(
-                self._get_attr(CONF_DEVICETRACKER_ID)
-            ).attributes.get(CONF_ZONE)
+            devicetracker_zone_id: str | None = devicetracker_state.attributes.get(CONF_ZONE)
             if devicetracker_zone_id:
                 devicetracker_zone_id = f"{CONF_ZONE}.{devicetracker_zone_id}"
                 devicetracker_zone_name_state = self._hass.states.get(devicetracker_zone_id)
@@ -784,141 +878,110 @@ class Places(SensorEntity):
             )
 
     async def _async_determine_if_update_needed(self) -> int:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         proceed_with_update = 1
         # 0: False. 1: True. 2: False, but set direction of travel to stationary
 
         if self._get_attr(ATTR_INITIAL_UPDATE):
-            _LOGGER.info("(%s) Performing Initial Update for user", self._get_attr(CONF_NAME))
+            _LOGGER.info("(%s) Performing Initial Update for user", sensor_name)
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
             return 1
 
-        if self._is_attr_blank(ATTR_NATIVE_VALUE) or (
-            isinstance(self._get_attr(ATTR_NATIVE_VALUE), str)
-            and self._get_attr_safe_str(ATTR_NATIVE_VALUE).lower()
-            in {"none", STATE_UNKNOWN, STATE_UNAVAILABLE}
+        native_value: Any = self._get_attr(ATTR_NATIVE_VALUE)
+        if native_value is None or (
+            isinstance(native_value, str) and native_value.lower() in UNKNOWN_STATES
         ):
-            _LOGGER.info(
-                "(%s) Previous State is Unknown, performing update", self._get_attr(CONF_NAME)
-            )
+            _LOGGER.info("(%s) Previous State is Unknown, performing update", sensor_name)
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
             return 1
 
         if self._get_attr(ATTR_LOCATION_CURRENT) == self._get_attr(ATTR_LOCATION_PREVIOUS):
             _LOGGER.info(
                 "(%s) Not performing update because coordinates are identical",
-                self._get_attr(CONF_NAME),
+                sensor_name,
             )
             return 2
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
-        if int(self._get_attr_safe_float(ATTR_DISTANCE_TRAVELED_M)) < 10:
+        distance_traveled: float = self._get_attr_safe_float(ATTR_DISTANCE_TRAVELED_M)
+        if distance_traveled < 10:
             _LOGGER.info(
                 "(%s) "
                 "Not performing update, distance traveled from last update is less than 10 m (%s m)",
-                self._get_attr(CONF_NAME),
-                round(self._get_attr_safe_float(ATTR_DISTANCE_TRAVELED_M), 1),
+                sensor_name,
+                round(distance_traveled, 1),
             )
             return 2
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
         return proceed_with_update
         # 0: False. 1: True. 2: False, but set direction of travel to stationary
 
-    def _get_dict_from_url(self, url: str, name: str, dict_name: str) -> None:
-        _LOGGER.info("(%s) Requesting data for %s", self._get_attr(CONF_NAME), name)
-        _LOGGER.debug("(%s) %s URL: %s", self._get_attr(CONF_NAME), name, url)
+    async def _async_get_dict_from_url(self, url: str, name: str, dict_name: str) -> None:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
+        _LOGGER.info("(%s) Requesting data for %s", sensor_name, name)
+        _LOGGER.debug("(%s) %s URL: %s", sensor_name, name, url)
         self._set_attr(dict_name, {})
-        headers: dict[str, str] = {"user-agent": f"Mozilla/5.0 (Home Assistant) {DOMAIN}/{VERSION}"}
-        try:
-            get_response: requests.Response | None = requests.get(url=url, headers=headers)
-        except requests.exceptions.RetryError as e:
-            get_response = None
-            _LOGGER.warning(
-                "(%s) Retry Error connecting to %s [%s: %s]: %s",
-                self._get_attr(CONF_NAME),
-                name,
-                e.__class__.__qualname__,
-                e,
-                url,
-            )
-            return
-        except requests.exceptions.ConnectionError as e:
-            get_response = None
-            _LOGGER.warning(
-                "(%s) Connection Error connecting to %s [%s: %s]: %s",
-                self._get_attr(CONF_NAME),
-                name,
-                e.__class__.__qualname__,
-                e,
-                url,
-            )
-            return
-        except requests.exceptions.HTTPError as e:
-            get_response = None
-            _LOGGER.warning(
-                "(%s) HTTP Error connecting to %s [%s: %s]: %s",
-                self._get_attr(CONF_NAME),
-                name,
-                e.__class__.__qualname__,
-                e,
-                url,
-            )
-            return
-        except requests.exceptions.Timeout as e:
-            get_response = None
-            _LOGGER.warning(
-                "(%s) Timeout connecting to %s [%s: %s]: %s",
-                self._get_attr(CONF_NAME),
-                name,
-                e.__class__.__qualname__,
-                e,
-                url,
-            )
-            return
-        except OSError as e:
-            # Includes error code 101, network unreachable
-            get_response = None
-            _LOGGER.warning(
-                "(%s) Network unreachable error when connecting to %s [%s: %s]: %s",
-                self._get_attr(CONF_NAME),
-                name,
-                e.__class__.__qualname__,
-                e,
-                url,
-            )
-            return
-        except NewConnectionError as e:
-            get_response = None
-            _LOGGER.warning(
-                "(%s) New Connection Error connecting to %s [%s: %s]: %s",
-                self._get_attr(CONF_NAME),
-                name,
-                e.__class__.__qualname__,
-                e,
-                url,
-            )
-            return
-
-        get_json_input: str | None = None
-        if get_response:
-            get_json_input = get_response.text
-            _LOGGER.debug("(%s) %s Response: %s", self._get_attr(CONF_NAME), name, get_json_input)
-
-        if get_json_input:
+        get_json_input: bytes = b""
+        for attempt in range(REQUEST_MAX_RETRIES + 1):
             try:
-                get_dict = json.loads(get_json_input)
-            except json.decoder.JSONDecodeError as e:
+                async with self._session.get(
+                    url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT
+                ) as response:
+                    response.raise_for_status()
+                    get_json_input = await response.read()
+                break
+            except (aiohttp.ClientError, TimeoutError) as e:
+                # Only retry transient failures: connection errors, timeouts and 5xx responses
+                retryable: bool = isinstance(e, aiohttp.ClientConnectionError | TimeoutError) or (
+                    isinstance(e, aiohttp.ClientResponseError) and e.status >= 500
+                )
+                if retryable and attempt < REQUEST_MAX_RETRIES:
+                    # Full jitter backoff
+                    delay: float = random.uniform(  # noqa: S311
+                        0, min(REQUEST_RETRY_CAP, REQUEST_RETRY_BASE * 2**attempt)
+                    )
+                    _LOGGER.debug(
+                        "(%s) Retrying %s in %.2fs (attempt %s of %s) [%s: %s]",
+                        sensor_name,
+                        name,
+                        delay,
+                        attempt + 1,
+                        REQUEST_MAX_RETRIES,
+                        e.__class__.__qualname__,
+                        e,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
                 _LOGGER.warning(
-                    "(%s) JSON Decode Error with %s info [%s: %s]: %s",
-                    self._get_attr(CONF_NAME),
+                    "(%s) Error connecting to %s [%s: %s]: %s",
+                    sensor_name,
                     name,
                     e.__class__.__qualname__,
                     e,
-                    get_json_input,
+                    url,
                 )
                 return
+
+        if not get_json_input:
+            _LOGGER.warning("(%s) Empty response from %s", sensor_name, name)
+            return
+        _LOGGER.debug("(%s) %s Response: %s", sensor_name, name, get_json_input)
+
+        try:
+            get_dict: Any = json_loads(get_json_input)
+        except JSON_DECODE_EXCEPTIONS as e:
+            _LOGGER.warning(
+                "(%s) JSON Decode Error with %s info [%s: %s]: %s",
+                sensor_name,
+                name,
+                e.__class__.__qualname__,
+                e,
+                get_json_input,
+            )
+            return
         if "error_message" in get_dict:
             _LOGGER.warning(
                 "(%s) An error occurred contacting the web service for %s: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 name,
                 get_dict.get("error_message"),
             )
@@ -936,72 +999,37 @@ class Places(SensorEntity):
         return
 
     async def _async_get_map_link(self) -> None:
-        if self._get_attr(CONF_MAP_PROVIDER) == "google":
-            self._set_attr(
-                ATTR_MAP_LINK,
-                (
-                    "https://maps.google.com/?q="
-                    f"{self._get_attr(ATTR_LOCATION_CURRENT)}"
-                    f"&ll={self._get_attr(ATTR_LOCATION_CURRENT)}"
-                    f"&z={self._get_attr(CONF_MAP_ZOOM)}"
-                ),
-            )
-        elif self._get_attr(CONF_MAP_PROVIDER) == "osm":
-            self._set_attr(
-                ATTR_MAP_LINK,
-                (
-                    "https://www.openstreetmap.org/?mlat="
-                    f"{self._get_attr(ATTR_LATITUDE)}"
-                    f"&mlon={self._get_attr(ATTR_LONGITUDE)}"
-                    f"#map={self._get_attr(CONF_MAP_ZOOM)}/"
-                    f"{self._get_attr_safe_str(ATTR_LATITUDE)[:8]}/"
-                    f"{self._get_attr_safe_str(ATTR_LONGITUDE)[:9]}"
-                ),
-            )
-        else:
-            self._set_attr(
-                ATTR_MAP_LINK,
-                (
-                    "https://maps.apple.com/maps/?q="
-                    f"{self._get_attr(ATTR_LOCATION_CURRENT)}"
-                    f"&z={self._get_attr(CONF_MAP_ZOOM)}"
-                ),
-            )
-        _LOGGER.debug(
-            "(%s) Map Link Type: %s", self._get_attr(CONF_NAME), self._get_attr(CONF_MAP_PROVIDER)
-        )
-        _LOGGER.debug(
-            "(%s) Map Link URL: %s", self._get_attr(CONF_NAME), self._get_attr(ATTR_MAP_LINK)
+        sensor_name: str | None = self._get_attr(CONF_NAME)
+        map_provider: Any = self._get_attr(CONF_MAP_PROVIDER)
+        # Coordinates are stored as strings, so they can be sliced directly
+        latitude: str = self._get_attr_safe_str(ATTR_LATITUDE)
+        longitude: str = self._get_attr_safe_str(ATTR_LONGITUDE)
+        map_link: str = MAP_LINK_URLS.get(map_provider, MAP_LINK_URLS[DEFAULT_MAP_PROVIDER]).format(
+            location=self._get_attr(ATTR_LOCATION_CURRENT),
+            zoom=self._get_attr(CONF_MAP_ZOOM),
+            latitude=latitude,
+            longitude=longitude,
+            latitude_short=latitude[:8],
+            longitude_short=longitude[:9],
         )
+        self._set_attr(ATTR_MAP_LINK, map_link)
+        _LOGGER.debug("(%s) Map Link Type: %s", sensor_name, map_provider)
+        _LOGGER.debug("(%s) Map Link URL: %s", sensor_name, map_link)
 
     async def _async_get_gps_accuracy(self) -> int:
-        if (
-            self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID))
-            and self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes
-            and ATTR_GPS_ACCURACY
-            in self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes
-            and self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                ATTR_GPS_ACCURACY
-            )
-            is not None
-            and _is_float(
-                self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                    ATTR_GPS_ACCURACY
-                )
-            )
-        ):
-            self._set_attr(
-                ATTR_GPS_ACCURACY,
-                float(
-                    self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                        ATTR_GPS_ACCURACY
-                    )
-                ),
-            )
+        sensor_name: str | None = self._get_attr(CONF_NAME)
+        devicetracker_state = self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID))
+        gps_accuracy: Any = (
+            devicetracker_state.attributes.get(ATTR_GPS_ACCURACY)
+            if devicetracker_state and devicetracker_state.attributes
+            else None
+        )
+        if gps_accuracy is not None and _is_float(gps_accuracy):
+            self._set_attr(ATTR_GPS_ACCURACY, float(gps_accuracy))
         else:
             _LOGGER.debug(
                 "(%s) GPS Accuracy attribute not found in: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 self._get_attr(CONF_DEVICETRACKER_ID),
             )
         proceed_with_update = 1
@@ -1011,13 +1039,11 @@ class Places(SensorEntity):
             if self._get_attr(CONF_USE_GPS) and self._get_attr(ATTR_GPS_ACCURACY) == 0:
                 proceed_with_update = 0
                 # 0: False. 1: True. 2: False, but set direction of travel to stationary
-                _LOGGER.info(
-                    "(%s) GPS Accuracy is 0.0, not performing update", self._get_attr(CONF_NAME)
-                )
+                _LOGGER.info("(%s) GPS Accuracy is 0.0, not performing update", sensor_name)
             else:
                 _LOGGER.debug(
                     "(%s) GPS Accuracy: %s",
-                    self._get_attr(CONF_NAME),
+                    sensor_name,
                     round(self._get_attr_safe_float(ATTR_GPS_ACCURACY), 3),
                 )
         return proceed_with_update
@@ -1064,24 +1090,28 @@ class Places(SensorEntity):
                 )
             else:
                 self._clear_attr(ATTR_PLACE_TYPE)
-        if "address" in osm_dict and self._get_attr(ATTR_PLACE_TYPE) in osm_dict["address"]:
+        address: MutableMapping[str, Any] | None = osm_dict.get("address")
+        place_type: str | None = self._get_attr(ATTR_PLACE_TYPE)
+        if address and place_type and place_type in address:
             self._set_attr(
                 ATTR_PLACE_NAME,
-                osm_dict["address"].get(self._get_attr(ATTR_PLACE_TYPE)),
+                address[place_type],
             )
 
     async def _parse_category(self, osm_dict: MutableMapping[str, Any]) -> None:
         if "category" not in osm_dict:
             return
 
+        place_category: str | None = osm_dict.get("category")
         self._set_attr(
             ATTR_PLACE_CATEGORY,
-            osm_dict.get("category"),
+            place_category,
         )
-        if "address" in osm_dict and self._get_attr(ATTR_PLACE_CATEGORY) in osm_dict["address"]:
+        address: MutableMapping[str, Any] | None = osm_dict.get("address")
+        if address and place_category and place_category in address:
             self._set_attr(
                 ATTR_PLACE_NAME,
-                osm_dict["address"].get(self._get_attr(ATTR_PLACE_CATEGORY)),
+                address[place_category],
             )
 
     async def _parse_namedetails(self, osm_dict: MutableMapping[str, Any]) -> None:
@@ -1113,167 +1143,109 @@ class Places(SensorEntity):
 
     async def _set_address_details(self, address: MutableMapping[str, Any]) -> None:
         if "house_number" in address:
-            self._set_attr(
-                ATTR_STREET_NUMBER,
-                address.get("house_number"),
-            )
+            self._set_attr(ATTR_STREET_NUMBER, address["house_number"])
         if "road" in address:
-            self._set_attr(
-                ATTR_STREET,
-                address.get("road"),
-            )
-        if "retail" in address and (
-            self._is_attr_blank(ATTR_PLACE_NAME)
-            or (
-                not self._is_attr_blank(ATTR_PLACE_CATEGORY)
-                and not self._is_attr_blank(ATTR_STREET)
+            self._set_attr(ATTR_STREET, address["road"])
+        if "retail" in address:
+            place_name: Any = self._get_attr(ATTR_PLACE_NAME)
+            street: Any = self._get_attr(ATTR_STREET)
+            if place_name is None or (
+                street is not None
+                and street == place_name
                 and self._get_attr(ATTR_PLACE_CATEGORY) == "highway"
-                and self._get_attr(ATTR_STREET) == self._get_attr(ATTR_PLACE_NAME)
-            )
-        ):
-            self._set_attr(
-                ATTR_PLACE_NAME,
-                self._get_attr_safe_dict(ATTR_OSM_DICT).get("address", {}).get("retail"),
-            )
+            ):
+                self._set_attr(ATTR_PLACE_NAME, address["retail"])
         _LOGGER.debug(
             "(%s) Place Name: %s", self._get_attr(CONF_NAME), self._get_attr(ATTR_PLACE_NAME)
         )
 
+    @staticmethod
+    def _find_address_type(
+        address: MutableMapping[str, Any], types: tuple[str, ...], skip: tuple[str, ...] = ()
+    ) -> int | None:
+        """Return the index of the first of types found in address, ignoring skipped types."""
+        return next(
+            (
+                idx
+                for idx, addr_type in enumerate(types)
+                if addr_type not in skip and addr_type in address
+            ),
+            None,
+        )
+
     async def _set_city_details(self, address: MutableMapping[str, Any]) -> None:
-        CITY_LIST: list[str] = [
-            "city",
-            "town",
-            "village",
-            "township",
-            "hamlet",
-            "city_district",
-            "municipality",
-        ]
-        POSTAL_TOWN_LIST: list[str] = [
-            "city",
-            "town",
-            "village",
-            "township",
-            "hamlet",
-            "borough",
-            "suburb",
-        ]
-        NEIGHBOURHOOD_LIST: list[str] = [
-            "village",
-            "township",
-            "hamlet",
-            "borough",
-            "suburb",
-            "quarter",
-            "neighbourhood",
-        ]
-        for city_type in CITY_LIST:
-            with contextlib.suppress(ValueError):
-                POSTAL_TOWN_LIST.remove(city_type)
-
-            with contextlib.suppress(ValueError):
-                NEIGHBOURHOOD_LIST.remove(city_type)
-            if city_type in address:
-                self._set_attr(
-                    ATTR_CITY,
-                    address.get(city_type),
-                )
-                break
-        for postal_town_type in POSTAL_TOWN_LIST:
-            with contextlib.suppress(ValueError):
-                NEIGHBOURHOOD_LIST.remove(postal_town_type)
-            if postal_town_type in address:
-                self._set_attr(
-                    ATTR_POSTAL_TOWN,
-                    address.get(postal_town_type),
-                )
-                break
-        for neighbourhood_type in NEIGHBOURHOOD_LIST:
-            if neighbourhood_type in address:
-                self._set_attr(
-                    ATTR_PLACE_NEIGHBOURHOOD,
-                    address.get(neighbourhood_type),
-                )
-                break
+        # A type checked for city (up to and including the match) is not reused for
+        # postal town or neighbourhood, and likewise for postal town types.
+        checked_city_types: tuple[str, ...] = CITY_TYPES
+        if (idx := Places._find_address_type(address, CITY_TYPES)) is not None:
+            self._set_attr(ATTR_CITY, address[CITY_TYPES[idx]])
+            checked_city_types = CITY_TYPES[: idx + 1]
+        checked_postal_town_types: tuple[str, ...] = POSTAL_TOWN_TYPES
+        if (
+            idx := Places._find_address_type(address, POSTAL_TOWN_TYPES, checked_city_types)
+        ) is not None:
+            self._set_attr(ATTR_POSTAL_TOWN, address[POSTAL_TOWN_TYPES[idx]])
+            checked_postal_town_types = POSTAL_TOWN_TYPES[: idx + 1]
+        if (
+            idx := Places._find_address_type(
+                address, NEIGHBOURHOOD_TYPES, checked_city_types + checked_postal_town_types
+            )
+        ) is not None:
+            self._set_attr(ATTR_PLACE_NEIGHBOURHOOD, address[NEIGHBOURHOOD_TYPES[idx]])
 
         if not self._is_attr_blank(ATTR_CITY):
             self._set_attr(
-                ATTR_CITY_CLEAN,
-                self._get_attr_safe_str(ATTR_CITY).replace(" Township", "").strip(),
+                ATTR_CITY_CLEAN, Places._clean_city_name(self._get_attr_safe_str(ATTR_CITY))
             )
-            if self._get_attr_safe_str(ATTR_CITY_CLEAN).startswith("City of"):
-                self._set_attr(
-                    ATTR_CITY_CLEAN,
-                    f"{self._get_attr_safe_str(ATTR_CITY_CLEAN)[8:]} City",
-                )
+
+    @staticmethod
+    def _clean_city_name(city: str) -> str:
+        city_clean: str = city.replace(" Township", "").strip()
+        if city_clean.startswith("City of"):
+            return f"{city_clean[8:]} City"
+        return city_clean
 
     async def _set_region_details(self, address: MutableMapping[str, Any]) -> None:
-        if "state" in address:
-            self._set_attr(
-                ATTR_REGION,
-                address.get("state"),
-            )
+        for osm_key, attr in OSM_ADDRESS_ATTRIBUTES:
+            if osm_key in address:
+                self._set_attr(attr, address[osm_key])
         if "ISO3166-2-lvl4" in address:
             self._set_attr(
                 ATTR_STATE_ABBR,
                 address["ISO3166-2-lvl4"].split("-")[1].upper(),
             )
-        if "county" in address:
-            self._set_attr(
-                ATTR_COUNTY,
-                address.get("county"),
-            )
-        if "country" in address:
-            self._set_attr(
-                ATTR_COUNTRY,
-                address.get("country"),
-            )
         if "country_code" in address:
             self._set_attr(
                 ATTR_COUNTRY_CODE,
                 address["country_code"].upper(),
             )
-        if "postcode" in address:
-            self._set_attr(
-                ATTR_POSTAL_CODE,
-                self._get_attr_safe_dict(ATTR_OSM_DICT).get("address", {}).get("postcode"),
-            )
 
     async def _parse_miscellaneous(self, osm_dict: MutableMapping[str, Any]) -> None:
         if "display_name" in osm_dict:
-            self._set_attr(
-                ATTR_FORMATTED_ADDRESS,
-                osm_dict.get("display_name"),
-            )
-
+            self._set_attr(ATTR_FORMATTED_ADDRESS, osm_dict["display_name"])
         if "osm_id" in osm_dict:
-            self._set_attr(
-                ATTR_OSM_ID,
-                str(self._get_attr_safe_dict(ATTR_OSM_DICT).get("osm_id", "")),
-            )
+            self._set_attr(ATTR_OSM_ID, str(osm_dict["osm_id"]))
         if "osm_type" in osm_dict:
-            self._set_attr(
-                ATTR_OSM_TYPE,
-                osm_dict.get("osm_type"),
-            )
+            self._set_attr(ATTR_OSM_TYPE, osm_dict["osm_type"])
 
+        namedetails: MutableMapping[str, Any] | None = osm_dict.get("namedetails")
         if (
             not self._is_attr_blank(ATTR_PLACE_CATEGORY)
             and self._get_attr_safe_str(ATTR_PLACE_CATEGORY).lower() == "highway"
-            and "namedetails" in osm_dict
-            and osm_dict.get("namedetails") is not None
-            and "ref" in osm_dict["namedetails"]
+            and namedetails
+            and "ref" in namedetails
         ):
-            street_refs: list = re.split(
-                r"[\;\\\/\,\.\:]",
-                osm_dict["namedetails"].get("ref"),
-            )
-            street_refs = [i for i in street_refs if i.strip()]  # Remove blank strings
-            # _LOGGER.debug("(%s) Street Refs: %s", self._get_attr(CONF_NAME), street_refs)
-            for ref in street_refs:
-                if bool(re.search(r"\d", ref)):
-                    self._set_attr(ATTR_STREET_REF, ref)
-                    break
+            # Use the first ref containing a number (a ref with a digit is never blank)
+            street_ref: str | None = next(
+                (
+                    ref
+                    for ref in STREET_REF_SPLIT_RE.split(namedetails["ref"])
+                    if DIGIT_RE.search(ref)
+                ),
+                None,
+            )
+            if street_ref:
+                self._set_attr(ATTR_STREET_REF, street_ref)
             if not self._is_attr_blank(ATTR_STREET_REF):
                 _LOGGER.debug(
                     "(%s) Street: %s / Street Ref: %s",
@@ -1298,93 +1270,76 @@ class Places(SensorEntity):
             self._set_attr(ATTR_PLACE_NAME_NO_DUPE, self._get_attr(ATTR_PLACE_NAME))
 
     async def _async_build_formatted_place(self) -> None:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         formatted_place_array: list[str] = []
         if not await self._async_in_zone():
             if not self._is_attr_blank(ATTR_DRIVING) and "driving" in (
                 self._get_attr_safe_list(ATTR_DISPLAY_OPTIONS_LIST)
             ):
-                formatted_place_array.append(self._get_attr_safe_str(ATTR_DRIVING))
+                formatted_place_array.append(self._get_attr_safe_str(ATTR_DRIVING).strip())
             # Don't use place name if the same as another attributes
             use_place_name: bool = True
-            sensor_attributes_values: list[str] = []
-            sensor_attributes_values.extend(
-                [
-                    self._get_attr_safe_str(attr)
-                    for attr in PLACE_NAME_DUPLICATE_LIST
-                    if not self._is_attr_blank(attr)
-                ]
-            )
-            # if not self._is_attr_blank(ATTR_PLACE_NAME):
+            sensor_attributes_values: list[str] = [
+                self._get_attr_safe_str(attr)
+                for attr in PLACE_NAME_DUPLICATE_LIST
+                if not self._is_attr_blank(attr)
+            ]
+            place_name: str = self._get_attr_safe_str(ATTR_PLACE_NAME)
+            # if place_name:
             # _LOGGER.debug(
             #     "(%s) Duplicated List [Place Name: %s]: %s",
             #     self._get_attr(CONF_NAME),
-            #     self._get_attr(ATTR_PLACE_NAME),
+            #     place_name,
             #     sensor_attributes_values,
             # )
-            if self._is_attr_blank(ATTR_PLACE_NAME):
+            if not place_name:
                 use_place_name = False
                 # _LOGGER.debug("(%s) Place Name is None", self._get_attr(CONF_NAME))
-            elif self._get_attr(ATTR_PLACE_NAME) in sensor_attributes_values:
-                # _LOGGER.debug("(%s) Not Using Place Name: %s", self._get_attr(CONF_NAME), self._get_attr(ATTR_PLACE_NAME))
+            elif place_name in sensor_attributes_values:
+                # _LOGGER.debug("(%s) Not Using Place Name: %s", self._get_attr(CONF_NAME), place_name)
                 use_place_name = False
-            _LOGGER.debug("(%s) use_place_name: %s", self._get_attr(CONF_NAME), use_place_name)
+            _LOGGER.debug("(%s) use_place_name: %s", sensor_name, use_place_name)
             if not use_place_name:
-                if (
-                    not self._is_attr_blank(ATTR_PLACE_TYPE)
-                    and self._get_attr_safe_str(ATTR_PLACE_TYPE).lower() != "unclassified"
-                    and self._get_attr_safe_str(ATTR_PLACE_CATEGORY).lower() != "highway"
-                ):
+                place_type: str = self._get_attr_safe_str(ATTR_PLACE_TYPE)
+                place_type_lower: str = place_type.lower()
+                place_category: str = self._get_attr_safe_str(ATTR_PLACE_CATEGORY)
+                is_highway: bool = place_category.lower() == "highway"
+                if place_type and place_type_lower != "unclassified" and not is_highway:
                     formatted_place_array.append(
-                        self._get_attr_safe_str(ATTR_PLACE_TYPE)
-                        .title()
+                        place_type.title()
                         .replace("Proposed", "")
                         .replace("Construction", "")
                         .strip()
                     )
-                elif (
-                    not self._is_attr_blank(ATTR_PLACE_CATEGORY)
-                    and self._get_attr_safe_str(ATTR_PLACE_CATEGORY).lower() != "highway"
-                ):
-                    formatted_place_array.append(
-                        self._get_attr_safe_str(ATTR_PLACE_CATEGORY).title().strip()
-                    )
+                elif place_category and not is_highway:
+                    formatted_place_array.append(place_category.title().strip())
+                street_name: str = self._get_attr_safe_str(ATTR_STREET)
+                street_ref: str = self._get_attr_safe_str(ATTR_STREET_REF)
                 street: str | None = None
-                if self._is_attr_blank(ATTR_STREET) and not self._is_attr_blank(ATTR_STREET_REF):
-                    street = self._get_attr_safe_str(ATTR_STREET_REF).strip()
-                    _LOGGER.debug("(%s) Using street_ref: %s", self._get_attr(CONF_NAME), street)
-                elif not self._is_attr_blank(ATTR_STREET):
-                    if (
-                        not self._is_attr_blank(ATTR_PLACE_CATEGORY)
-                        and self._get_attr_safe_str(ATTR_PLACE_CATEGORY).lower() == "highway"
-                        and not self._is_attr_blank(ATTR_PLACE_TYPE)
-                        and self._get_attr_safe_str(ATTR_PLACE_TYPE).lower()
-                        in {"motorway", "trunk"}
-                        and not self._is_attr_blank(ATTR_STREET_REF)
-                    ):
-                        street = self._get_attr_safe_str(ATTR_STREET_REF).strip()
-                        _LOGGER.debug(
-                            "(%s) Using street_ref: %s", self._get_attr(CONF_NAME), street
-                        )
+                if not street_name and street_ref:
+                    street = street_ref.strip()
+                    _LOGGER.debug("(%s) Using street_ref: %s", sensor_name, street)
+                elif street_name:
+                    if is_highway and place_type_lower in {"motorway", "trunk"} and street_ref:
+                        street = street_ref.strip()
+                        _LOGGER.debug("(%s) Using street_ref: %s", sensor_name, street)
                     else:
-                        street = self._get_attr_safe_str(ATTR_STREET).strip()
-                        _LOGGER.debug("(%s) Using street: %s", self._get_attr(CONF_NAME), street)
-                if street and self._is_attr_blank(ATTR_STREET_NUMBER):
+                        street = street_name.strip()
+                        _LOGGER.debug("(%s) Using street: %s", sensor_name, street)
+                street_number: str = self._get_attr_safe_str(ATTR_STREET_NUMBER)
+                if street and not street_number:
                     formatted_place_array.append(street)
-                elif street and not self._is_attr_blank(ATTR_STREET_NUMBER):
-                    formatted_place_array.append(
-                        f"{self._get_attr_safe_str(ATTR_STREET_NUMBER).strip()} {street}"
-                    )
-                if (
-                    not self._is_attr_blank(ATTR_PLACE_TYPE)
-                    and self._get_attr_safe_str(ATTR_PLACE_TYPE).lower() == "house"
-                    and not self._is_attr_blank(ATTR_PLACE_NEIGHBOURHOOD)
+                elif street:
+                    formatted_place_array.append(f"{street_number.strip()} {street}")
+                if place_type_lower == "house" and not self._is_attr_blank(
+                    ATTR_PLACE_NEIGHBOURHOOD
                 ):
                     formatted_place_array.append(
                         self._get_attr_safe_str(ATTR_PLACE_NEIGHBOURHOOD).strip()
                     )
 
             else:
-                formatted_place_array.append(self._get_attr_safe_str(ATTR_PLACE_NAME).strip())
+                formatted_place_array.append(place_name.strip())
             if not self._is_attr_blank(ATTR_CITY_CLEAN):
                 formatted_place_array.append(self._get_attr_safe_str(ATTR_CITY_CLEAN).strip())
             elif not self._is_attr_blank(ATTR_CITY):
@@ -1392,16 +1347,17 @@ class Places(SensorEntity):
             elif not self._is_attr_blank(ATTR_COUNTY):
                 formatted_place_array.append(self._get_attr_safe_str(ATTR_COUNTY).strip())
             if not self._is_attr_blank(ATTR_STATE_ABBR):
-                formatted_place_array.append(self._get_attr_safe_str(ATTR_STATE_ABBR))
+                formatted_place_array.append(self._get_attr_safe_str(ATTR_STATE_ABBR).strip())
         else:
             formatted_place_array.append(
                 self._get_attr_safe_str(ATTR_DEVICETRACKER_ZONE_NAME).strip()
             )
-        formatted_place: str = ", ".join(item for item in formatted_place_array)
-        formatted_place = formatted_place.replace("\n", " ").replace("  ", " ").strip()
+        formatted_place: str = ", ".join(formatted_place_array)
+        # Collapse newlines and runs of whitespace into single spaces
+        formatted_place = " ".join(formatted_place.split())
         self._set_attr(ATTR_FORMATTED_PLACE, formatted_place)
 
-    async def _do_brackets_and_parens_count_match(self, curr_options: str) -> bool:
+    def _do_brackets_and_parens_count_match(self, curr_options: str) -> bool:
         if curr_options.count("[") != curr_options.count("]"):
             _LOGGER.error(
                 "(%s) [adv_options] Bracket Count Mismatch: %s",
@@ -1419,24 +1375,69 @@ class Places(SensorEntity):
         return True
 
     async def _async_build_from_advanced_options(self, curr_options: str) -> None:
-        _LOGGER.debug("(%s) [adv_options] Options: %s", self._get_attr(CONF_NAME), curr_options)
-        if not await self._do_brackets_and_parens_count_match(curr_options) or not curr_options:
-            return
-
-        # _LOGGER.debug("(%s) [adv_options] Options has a [ or ( and optional ,", self._get_attr(CONF_NAME))
-        if "[" in curr_options or "(" in curr_options:
-            await self._process_advanced_bracket_or_parens(curr_options=curr_options)
-            return
+        sensor_name: str | None = self._get_attr(CONF_NAME)
+        in_zone: bool = await self._async_in_zone()
+        if self._adv_options_cache is None or self._adv_options_cache[0] != curr_options:
+            self._adv_options_cache = (
+                curr_options,
+                tuple(self._parse_advanced_options(curr_options)),
+            )
+        # Stack of option iterators; a fallback is pushed when its option has no state
+        pending: list[Iterator[AdvancedOption]] = [iter(self._adv_options_cache[1])]
+        while pending:
+            adv_option: AdvancedOption | None = next(pending[-1], None)
+            if adv_option is None:
+                pending.pop()
+                continue
+            ret_state: str | None = self._get_option_state(
+                adv_option.opt,
+                in_zone,
+                adv_option.incl,
+                adv_option.excl,
+                adv_option.incl_attr,
+                adv_option.excl_attr,
+            )
+            if ret_state:
+                self._adv_options_state_list.append(ret_state)
+                _LOGGER.debug(
+                    "(%s) [adv_options] Updated state list: %s",
+                    sensor_name,
+                    self._adv_options_state_list,
+                )
+            elif adv_option.fallback:
+                pending.append(iter(adv_option.fallback))
+
+    def _parse_advanced_options(self, curr_options: str | None) -> list[AdvancedOption]:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
+        adv_options: list[AdvancedOption] = []
+        while curr_options is not None:
+            _LOGGER.debug("(%s) [adv_options] Options: %s", sensor_name, curr_options)
+            if not self._do_brackets_and_parens_count_match(curr_options) or not curr_options:
+                break
 
-        # _LOGGER.debug("(%s) [adv_options] Options has , but no [ or (, splitting", self._get_attr(CONF_NAME))
-        if "," in curr_options:
-            await self._process_advanced_only_commas(curr_options=curr_options)
-            return
+            # _LOGGER.debug("(%s) [adv_options] Options has a [ or ( and optional ,", self._get_attr(CONF_NAME))
+            if "[" in curr_options or "(" in curr_options:
+                adv_option, curr_options = self._parse_advanced_bracket_or_parens(curr_options)
+                if adv_option is not None:
+                    adv_options.append(adv_option)
+                continue
+
+            # _LOGGER.debug("(%s) [adv_options] Options has , but no [ or (, splitting", self._get_attr(CONF_NAME))
+            if "," in curr_options:
+                adv_options.extend(
+                    AdvancedOption(opt.strip()) for opt in curr_options.split(",") if opt
+                )
+                break
 
-        # _LOGGER.debug("(%s) [adv_options] Options should just be a single term", self._get_attr(CONF_NAME))
-        await self._process_advanced_single_term(curr_options=curr_options)
+            # _LOGGER.debug("(%s) [adv_options] Options should just be a single term", self._get_attr(CONF_NAME))
+            adv_options.append(AdvancedOption(curr_options.strip()))
+            break
+        return adv_options
 
-    async def _process_advanced_bracket_or_parens(self, curr_options: str) -> None:
+    def _parse_advanced_bracket_or_parens(
+        self, curr_options: str
+    ) -> tuple[AdvancedOption | None, str | None]:
+        """Parse the first option and return it with the remaining options."""
         incl: list[str] = []
         excl: list[str] = []
         incl_attr: MutableMapping[str, Any] = {}
@@ -1445,138 +1446,64 @@ class Places(SensorEntity):
         next_opt: str | None = None
 
         # _LOGGER.debug("(%s) [adv_options] Options has a [ or ( and optional ,", self._get_attr(CONF_NAME))
-        comma_num: int = curr_options.find(",")
-        bracket_num: int = curr_options.find("[")
-        paren_num: int = curr_options.find("(")
+        delim_match: re.Match[str] | None = ADV_OPTIONS_DELIM_RE.search(curr_options)
+        if delim_match is None:
+            return None, None
+        delim_num: int = delim_match.start()
+        opt: str = curr_options[:delim_num]
 
         # Comma is first symbol
-        if (
-            comma_num != -1
-            and (bracket_num == -1 or comma_num < bracket_num)
-            and (paren_num == -1 or comma_num < paren_num)
-        ):
+        if delim_match[0] == ",":
             # _LOGGER.debug("(%s) [adv_options] Comma is First", self._get_attr(CONF_NAME))
-            opt: str = curr_options[:comma_num]
             # _LOGGER.debug("(%s) [adv_options] Option: %s", self._get_attr(CONF_NAME), opt)
-            if opt:
-                ret_state: str | None = await self._async_get_option_state(opt.strip())
-                if ret_state:
-                    self._adv_options_state_list.append(ret_state)
-                    _LOGGER.debug(
-                        "(%s) [adv_options] Updated state list: %s",
-                        self._get_attr(CONF_NAME),
-                        self._adv_options_state_list,
-                    )
-            next_opt = curr_options[(comma_num + 1) :]
+            next_opt = curr_options[(delim_num + 1) :]
             # _LOGGER.debug("(%s) [adv_options] Next Options: %s",self._get_attr(CONF_NAME), next_opt)
-            if next_opt:
-                await self._async_build_from_advanced_options(next_opt.strip())
-                # _LOGGER.debug("(%s) [adv_options] Back from recursion", self._get_attr(CONF_NAME))
-            return
+            return (
+                AdvancedOption(opt.strip()) if opt else None,
+                next_opt.strip() if next_opt else None,
+            )
 
         # Bracket is first symbol
-        if (
-            bracket_num != -1
-            and (comma_num == -1 or bracket_num < comma_num)
-            and (paren_num == -1 or bracket_num < paren_num)
-        ):
+        if delim_match[0] == "[":
             # _LOGGER.debug("(%s) [adv_options] Bracket is First", self._get_attr(CONF_NAME))
-            opt = curr_options[:bracket_num]
             # _LOGGER.debug("(%s) [adv_options] Option: %s", self._get_attr(CONF_NAME), opt)
-            none_opt, next_opt = await self._async_parse_bracket(curr_options[bracket_num:])
+            none_opt, next_opt = self._parse_bracket(curr_options[delim_num:])
             if next_opt and len(next_opt) > 1 and next_opt[0] == "(":
                 # Parse Parenthesis
-                incl, excl, incl_attr, excl_attr, next_opt = await self._async_parse_parens(
-                    next_opt
-                )
-
-            if opt:
-                ret_state = await self._async_get_option_state(
-                    opt.strip(), incl, excl, incl_attr, excl_attr
-                )
-                if ret_state:
-                    self._adv_options_state_list.append(ret_state)
-                    _LOGGER.debug(
-                        "(%s) [adv_options] Updated state list: %s",
-                        self._get_attr(CONF_NAME),
-                        self._adv_options_state_list,
-                    )
-                elif none_opt:
-                    await self._async_build_from_advanced_options(none_opt.strip())
-                    # _LOGGER.debug("(%s) [adv_options] Back from recursion", self._get_attr(CONF_NAME))
-
-            if next_opt and len(next_opt) > 1 and next_opt[0] == ",":
-                next_opt = next_opt[1:]
-                # _LOGGER.debug("(%s) [adv_options] Next Options: %s", self._get_attr(CONF_NAME), next_opt)
-                if next_opt:
-                    await self._async_build_from_advanced_options(next_opt.strip())
-                    # _LOGGER.debug("(%s) [adv_options] Back from recursion", self._get_attr(CONF_NAME))
-            return
+                incl, excl, incl_attr, excl_attr, next_opt = self._parse_parens(next_opt)
 
         # Parenthesis is first symbol
-        if (
-            paren_num != -1
-            and (comma_num == -1 or paren_num < comma_num)
-            and (bracket_num == -1 or paren_num < bracket_num)
-        ):
+        else:
             # _LOGGER.debug("(%s) [adv_options] Parenthesis is First", self._get_attr(CONF_NAME))
-            opt = curr_options[:paren_num]
             _LOGGER.debug("(%s) [adv_options] Option: %s", self._get_attr(CONF_NAME), opt)
-            incl, excl, incl_attr, excl_attr, next_opt = await self._async_parse_parens(
-                curr_options[paren_num:]
+            incl, excl, incl_attr, excl_attr, next_opt = self._parse_parens(
+                curr_options[delim_num:]
             )
             if next_opt and len(next_opt) > 1 and next_opt[0] == "[":
                 # Parse Bracket
-                none_opt, next_opt = await self._async_parse_bracket(next_opt)
-
-            if opt:
-                ret_state = await self._async_get_option_state(
-                    opt.strip(), incl, excl, incl_attr, excl_attr
-                )
-                if ret_state:
-                    self._adv_options_state_list.append(ret_state)
-                    _LOGGER.debug(
-                        "(%s) [adv_options] Updated state list: %s",
-                        self._get_attr(CONF_NAME),
-                        self._adv_options_state_list,
-                    )
-                elif none_opt:
-                    await self._async_build_from_advanced_options(none_opt.strip())
-                    # _LOGGER.debug("(%s) [adv_options] Back from recursion", self._get_attr(CONF_NAME))
-
-            if next_opt and len(next_opt) > 1 and next_opt[0] == ",":
-                next_opt = next_opt[1:]
-                # _LOGGER.debug("(%s) [adv_options] Next Options: %s", self._get_attr(CONF_NAME), next_opt)
-                if next_opt:
-                    await self._async_build_from_advanced_options(next_opt.strip())
-                    # _LOGGER.debug("(%s) [adv_options] Back from recursion", self._get_attr(CONF_NAME))
-
-    async def _process_advanced_only_commas(self, curr_options: str) -> None:
-        # _LOGGER.debug("(%s) [adv_options] Options has , but no [ or (, splitting", self._get_attr(CONF_NAME))
-        for opt in curr_options.split(","):
-            if opt is not None and opt:
-                ret_state = await self._async_get_option_state(opt.strip())
-                if ret_state is not None and ret_state:
-                    self._adv_options_state_list.append(ret_state)
-                    _LOGGER.debug(
-                        "(%s) [adv_options] Updated state list: %s",
-                        self._get_attr(CONF_NAME),
-                        self._adv_options_state_list,
-                    )
-
-    async def _process_advanced_single_term(self, curr_options: str) -> None:
-        ret_state = await self._async_get_option_state(curr_options.strip())
-        if ret_state is not None and ret_state:
-            self._adv_options_state_list.append(ret_state)
-            _LOGGER.debug(
-                "(%s) [adv_options] Updated state list: %s",
-                self._get_attr(CONF_NAME),
-                self._adv_options_state_list,
-            )
+                none_opt, next_opt = self._parse_bracket(next_opt)
 
-    async def _async_parse_parens(
+        adv_option: AdvancedOption | None = None
+        if opt:
+            adv_option = AdvancedOption(
+                opt.strip(),
+                incl,
+                excl,
+                incl_attr,
+                excl_attr,
+                tuple(self._parse_advanced_options(none_opt.strip())) if none_opt else (),
+            )
+
+        if next_opt and len(next_opt) > 1 and next_opt[0] == ",":
+            next_opt = next_opt[1:]
+            # _LOGGER.debug("(%s) [adv_options] Next Options: %s", self._get_attr(CONF_NAME), next_opt)
+            return adv_option, next_opt.strip() if next_opt else None
+        return adv_option, None
+
+    def _parse_parens(
         self, curr_options: str
     ) -> tuple[list, list, MutableMapping[str, Any], MutableMapping[str, Any], str | None]:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         incl: list = []
         excl: list = []
         incl_attr: MutableMapping[str, Any] = {}
@@ -1626,7 +1553,7 @@ class Places(SensorEntity):
                         if ")" not in item or item.count("(") > 1 or item.count(")") > 1:
                             _LOGGER.error(
                                 "(%s) [parse_parens] Parenthesis Mismatch: %s",
-                                self._get_attr(CONF_NAME),
+                                sensor_name,
                                 item,
                             )
                             continue
@@ -1651,27 +1578,27 @@ class Places(SensorEntity):
                             #     paren_attr,
                             #     attr_item,
                             # )
-                            paren_attr_list.append(str(attr_item).strip().lower())
+                            paren_attr_list.append(attr_item.strip().lower())
                         if paren_attr_incl:
                             incl_attr.update({paren_attr: paren_attr_list})
                         else:
                             excl_attr.update({paren_attr: paren_attr_list})
                     elif paren_incl:
-                        incl.append(str(item).strip().lower())
+                        incl.append(item.lower())
                     else:
-                        excl.append(str(item).strip().lower())
+                        excl.append(item.lower())
 
         elif not empty_paren:
             _LOGGER.error(
                 "(%s) [parse_parens] Parenthesis Mismatch: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 curr_options,
             )
         next_opt = curr_options[(close_paren_num + 1) :]
         # _LOGGER.debug("(%s) [parse_parens] Raw Next Options: %s", self._get_attr(CONF_NAME), next_opt)
         return incl, excl, incl_attr, excl_attr, next_opt
 
-    async def _async_parse_bracket(self, curr_options: str) -> tuple[str | None, str | None]:
+    def _parse_bracket(self, curr_options: str) -> tuple[str | None, str | None]:
         # _LOGGER.debug("(%s) [parse_bracket] Options: %s", self._get_attr(CONF_NAME), curr_options)
         empty_bracket: bool = False
         none_opt: str | None = None
@@ -1707,36 +1634,33 @@ class Places(SensorEntity):
             )
         return none_opt, next_opt
 
-    async def _async_get_option_state(
+    def _get_option_state(
         self,
         opt: str,
+        in_zone: bool,
         incl: list | None = None,
         excl: list | None = None,
         incl_attr: MutableMapping[str, Any] | None = None,
         excl_attr: MutableMapping[str, Any] | None = None,
     ) -> str | None:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         incl = [] if incl is None else incl
         excl = [] if excl is None else excl
         incl_attr = {} if incl_attr is None else incl_attr
         excl_attr = {} if excl_attr is None else excl_attr
         if opt:
             opt = str(opt).lower().strip()
-        _LOGGER.debug("(%s) [get_option_state] Option: %s", self._get_attr(CONF_NAME), opt)
-        out: str | None = self._get_attr(DISPLAY_OPTIONS_MAP.get(opt))
-        if (
-            DISPLAY_OPTIONS_MAP.get(opt) in {ATTR_DEVICETRACKER_ZONE, ATTR_DEVICETRACKER_ZONE_NAME}
-            and not await self._async_in_zone()
-        ):
+        _LOGGER.debug("(%s) [get_option_state] Option: %s", sensor_name, opt)
+        map_opt: str | None = DISPLAY_OPTIONS_MAP.get(opt)
+        out: str | None = self._get_attr(map_opt)
+        if map_opt in {ATTR_DEVICETRACKER_ZONE, ATTR_DEVICETRACKER_ZONE_NAME} and not in_zone:
             out = None
-        _LOGGER.debug("(%s) [get_option_state] State: %s", self._get_attr(CONF_NAME), out)
-        _LOGGER.debug("(%s) [get_option_state] incl list: %s", self._get_attr(CONF_NAME), incl)
-        _LOGGER.debug("(%s) [get_option_state] excl list: %s", self._get_attr(CONF_NAME), excl)
-        _LOGGER.debug(
-            "(%s) [get_option_state] incl_attr dict: %s", self._get_attr(CONF_NAME), incl_attr
-        )
-        _LOGGER.debug(
-            "(%s) [get_option_state] excl_attr dict: %s", self._get_attr(CONF_NAME), excl_attr
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("(%s) [get_option_state] State: %s", sensor_name, out)
+            _LOGGER.debug("(%s) [get_option_state] incl list: %s", sensor_name, incl)
+            _LOGGER.debug("(%s) [get_option_state] excl list: %s", sensor_name, excl)
+            _LOGGER.debug("(%s) [get_option_state] incl_attr dict: %s", sensor_name, incl_attr)
+            _LOGGER.debug("(%s) [get_option_state] excl_attr dict: %s", sensor_name, excl_attr)
         if out:
             if (
                 incl
@@ -1745,59 +1669,60 @@ class Places(SensorEntity):
                 and str(out).strip().lower() in excl
             ):
                 out = None
-            if incl_attr:
+            if out and incl_attr:
                 for attr, states in incl_attr.items():
-                    _LOGGER.debug(
-                        "(%s) [get_option_state] incl_attr: %s / State: %s",
-                        self._get_attr(CONF_NAME),
-                        attr,
-                        self._get_attr(DISPLAY_OPTIONS_MAP.get(attr)),
-                    )
-                    _LOGGER.debug(
-                        "(%s) [get_option_state] incl_states: %s", self._get_attr(CONF_NAME), states
-                    )
                     map_attr: str | None = DISPLAY_OPTIONS_MAP.get(attr)
-                    if (
-                        not map_attr
-                        or self._is_attr_blank(map_attr)
-                        or self._get_attr(map_attr) not in states
-                    ):
+                    attr_state: Any = self._get_attr(map_attr)
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "(%s) [get_option_state] incl_attr: %s / State: %s",
+                            sensor_name,
+                            attr,
+                            attr_state,
+                        )
+                        _LOGGER.debug(
+                            "(%s) [get_option_state] incl_states: %s",
+                            sensor_name,
+                            states,
+                        )
+                    if not map_attr or self._is_attr_blank(map_attr) or attr_state not in states:
                         out = None
-            if excl_attr:
+                        break
+            if out and excl_attr:
                 for attr, states in excl_attr.items():
-                    _LOGGER.debug(
-                        "(%s) [get_option_state] excl_attr: %s / State: %s",
-                        self._get_attr(CONF_NAME),
-                        attr,
-                        self._get_attr(DISPLAY_OPTIONS_MAP.get(attr)),
-                    )
-                    _LOGGER.debug(
-                        "(%s) [get_option_state] excl_states: %s", self._get_attr(CONF_NAME), states
-                    )
-                    if self._get_attr(DISPLAY_OPTIONS_MAP.get(attr)) in states:
+                    attr_state = self._get_attr(DISPLAY_OPTIONS_MAP.get(attr))
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "(%s) [get_option_state] excl_attr: %s / State: %s",
+                            sensor_name,
+                            attr,
+                            attr_state,
+                        )
+                        _LOGGER.debug(
+                            "(%s) [get_option_state] excl_states: %s",
+                            sensor_name,
+                            states,
+                        )
+                    if attr_state in states:
                         out = None
-            _LOGGER.debug(
-                "(%s) [get_option_state] State after incl/excl: %s", self._get_attr(CONF_NAME), out
-            )
+                        break
+            _LOGGER.debug("(%s) [get_option_state] State after incl/excl: %s", sensor_name, out)
         if out:
-            if out == out.lower() and (
-                DISPLAY_OPTIONS_MAP.get(opt) == ATTR_DEVICETRACKER_ZONE_NAME
-                or DISPLAY_OPTIONS_MAP.get(opt) == ATTR_PLACE_TYPE
-                or DISPLAY_OPTIONS_MAP.get(opt) == ATTR_PLACE_CATEGORY
-            ):
+            if out == out.lower() and map_opt in {
+                ATTR_DEVICETRACKER_ZONE_NAME,
+                ATTR_PLACE_TYPE,
+                ATTR_PLACE_CATEGORY,
+            }:
                 out = out.title()
             out = out.strip()
-            if (
-                DISPLAY_OPTIONS_MAP.get(opt) == ATTR_STREET
-                or DISPLAY_OPTIONS_MAP.get(opt) == ATTR_STREET_REF
-            ):
+            if map_opt in {ATTR_STREET, ATTR_STREET_REF}:
                 self._street_i = self._temp_i
                 # _LOGGER.debug(
                 #     "(%s) [get_option_state] street_i: %s",
                 #     self._get_attr(CONF_NAME),
                 #     self._street_i,
                 # )
-            if DISPLAY_OPTIONS_MAP.get(opt) == ATTR_STREET_NUMBER:
+            if map_opt == ATTR_STREET_NUMBER:
                 self._street_num_i = self._temp_i
                 # _LOGGER.debug(
                 #     "(%s) [get_option_state] street_num_i: %s",
@@ -1810,28 +1735,17 @@ class Places(SensorEntity):
 
     async def _async_compile_state_from_advanced_options(self) -> None:
         self._street_num_i += 1
-        first: bool = True
+        state_parts: list[str] = []
         for i, out in enumerate(self._adv_options_state_list):
             if out is not None and out:
-                out = out.strip()
-                if first:
-                    self._set_attr(ATTR_NATIVE_VALUE, str(out))
-                    first = False
-                else:
-                    if i == self._street_i and i == self._street_num_i:
-                        self._set_attr(
-                            ATTR_NATIVE_VALUE,
-                            f"{self._get_attr(ATTR_NATIVE_VALUE)} ",
-                        )
-                    else:
-                        self._set_attr(
-                            ATTR_NATIVE_VALUE,
-                            f"{self._get_attr(ATTR_NATIVE_VALUE)}, ",
-                        )
-                    self._set_attr(
-                        ATTR_NATIVE_VALUE,
-                        f"{self._get_attr(ATTR_NATIVE_VALUE)}{out}",
+                if state_parts:
+                    # A street number directly before its street is joined with a space
+                    state_parts.append(
+                        " " if i == self._street_i and i == self._street_num_i else ", "
                     )
+                state_parts.append(out.strip())
+        if state_parts:
+            self._set_attr(ATTR_NATIVE_VALUE, "".join(state_parts))
 
         _LOGGER.debug(
             "(%s) New State from Advanced Display Options: %s",
@@ -1840,10 +1754,12 @@ class Places(SensorEntity):
         )
 
     async def _async_build_state_from_display_options(self) -> None:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         display_options: list[str] = self._get_attr_safe_list(ATTR_DISPLAY_OPTIONS_LIST)
+        display_options_set: frozenset[str] = frozenset(display_options)
         _LOGGER.debug(
             "(%s) Building State from Display Options: %s",
-            self._get_attr(CONF_NAME),
+            sensor_name,
             self._get_attr(ATTR_DISPLAY_OPTIONS),
         )
 
@@ -1855,30 +1771,33 @@ class Places(SensorEntity):
         ) -> None:
             """Add attribute value to user_display if the conditions are met."""
             if (
-                (not require_in_display_options or option_key in display_options)
+                (not require_in_display_options or option_key in display_options_set)
                 and not self._is_attr_blank(attr_key)
                 and condition
             ):
                 user_display.append(self._get_attr_safe_str(attr_key))
 
         user_display: list[str] = []
+        show_zone: bool = (
+            await self._async_in_zone() or "do_not_show_not_home" not in display_options_set
+        )
 
         # Add basic options
         add_to_display(option_key="driving", attr_key=ATTR_DRIVING)
         add_to_display(
             option_key="zone_name",
             attr_key=ATTR_DEVICETRACKER_ZONE_NAME,
-            condition=await self._async_in_zone() or "do_not_show_not_home" not in display_options,
+            condition=show_zone,
         )
         add_to_display(
             option_key="zone",
             attr_key=ATTR_DEVICETRACKER_ZONE,
-            condition=await self._async_in_zone() or "do_not_show_not_home" not in display_options,
+            condition=show_zone,
         )
         add_to_display("place_name", ATTR_PLACE_NAME)
 
         # Handle "place" and its sub-options
-        if "place" in display_options:
+        if "place" in display_options_set:
             add_to_display(
                 attr_key=ATTR_PLACE_NAME,
                 condition=self._get_attr(ATTR_PLACE_NAME) != self._get_attr(ATTR_STREET),
@@ -1911,29 +1830,15 @@ class Places(SensorEntity):
             add_to_display(option_key="street", attr_key=ATTR_STREET)
 
         # Add remaining location details
-        for option_key, attr_key in {
-            "city": ATTR_CITY,
-            "county": ATTR_COUNTY,
-            "state": ATTR_REGION,
-            "region": ATTR_REGION,
-            "postal_code": ATTR_POSTAL_CODE,
-            "country": ATTR_COUNTRY,
-            "formatted_address": ATTR_FORMATTED_ADDRESS,
-        }.items():
+        for option_key, attr_key in DISPLAY_OPTIONS_LOCATION_DETAILS:
             add_to_display(option_key=option_key, attr_key=attr_key)
 
         # Handle "do_not_reorder" option
-        if "do_not_reorder" in display_options:
+        if "do_not_reorder" in display_options_set:
             user_display = []
             display_options.remove("do_not_reorder")
             for option in display_options:
-                attr_key = (
-                    "region"
-                    if option == "state"
-                    else "place_neighbourhood"
-                    if option == "place_neighborhood"
-                    else option
-                )
+                attr_key = DISPLAY_OPTIONS_MAP.get(option, option)
                 if not self._is_attr_blank(attr_key):
                     user_display.append(self._get_attr_safe_str(attr_key))
 
@@ -1942,32 +1847,35 @@ class Places(SensorEntity):
             self._set_attr(ATTR_NATIVE_VALUE, ", ".join(user_display))
         _LOGGER.debug(
             "(%s) New State from Display Options: %s",
-            self._get_attr(CONF_NAME),
+            sensor_name,
             self._get_attr(ATTR_NATIVE_VALUE),
         )
 
     async def _async_get_extended_attr(self) -> None:
         if not self._is_attr_blank(ATTR_OSM_ID) and not self._is_attr_blank(ATTR_OSM_TYPE):
-            if self._get_attr_safe_str(ATTR_OSM_TYPE).lower() == "node":
-                osm_type_abbr = "N"
-            elif self._get_attr_safe_str(ATTR_OSM_TYPE).lower() == "way":
-                osm_type_abbr = "W"
-            elif self._get_attr_safe_str(ATTR_OSM_TYPE).lower() == "relation":
-                osm_type_abbr = "R"
-
-            osm_details_url: str = (
-                "https://nominatim.openstreetmap.org/lookup?osm_ids="
-                f"{osm_type_abbr}{self._get_attr(ATTR_OSM_ID)}"
-                "&format=json&addressdetails=1&extratags=1&namedetails=1"
-                f"&email={
-                    self._get_attr(CONF_API_KEY) if not self._is_attr_blank(CONF_API_KEY) else ''
-                }"
-                f"&accept-language={
-                    self._get_attr(CONF_LANGUAGE) if not self._is_attr_blank(CONF_LANGUAGE) else ''
-                }"
+            osm_type_abbr: str | None = OSM_TYPE_ABBR.get(
+                self._get_attr_safe_str(ATTR_OSM_TYPE).lower()
             )
-            await self._hass.async_add_executor_job(
-                self._get_dict_from_url,
+            if osm_type_abbr is None:
+                _LOGGER.warning(
+                    "(%s) Unknown OSM Type, not getting OpenStreetMaps Details: %s",
+                    self._get_attr(CONF_NAME),
+                    self._get_attr(ATTR_OSM_TYPE),
+                )
+                return
+            osm_details_params: MutableMapping[str, Any] = {
+                "osm_ids": f"{osm_type_abbr}{self._get_attr(ATTR_OSM_ID)}",
+                "format": "json",
+                "addressdetails": 1,
+                "extratags": 1,
+                "namedetails": 1,
+            }
+            if not self._is_attr_blank(CONF_API_KEY):
+                osm_details_params["email"] = self._get_attr(CONF_API_KEY)
+            if not self._is_attr_blank(CONF_LANGUAGE):
+                osm_details_params["accept-language"] = self._get_attr(CONF_LANGUAGE)
+            osm_details_url: str = f"{OSM_DETAILS_URL}?{urlencode(osm_details_params)}"
+            await self._async_get_dict_from_url(
                 osm_details_url,
                 "OpenStreetMaps Details",
                 ATTR_OSM_DETAILS_DICT,
@@ -1979,77 +1887,110 @@ class Places(SensorEntity):
                     "(%s) OSM Details Dict: %s", self._get_attr(CONF_NAME), osm_details_dict
                 )
 
-                if (
-                    "extratags" in osm_details_dict
-                    and osm_details_dict.get("extratags") is not None
-                    and "wikidata" in osm_details_dict.get("extratags", {})
-                    and osm_details_dict.get("extratags", {}).get("wikidata") is not None
-                ):
-                    self._set_attr(
-                        ATTR_WIKIDATA_ID,
-                        osm_details_dict.get("extratags", {}).get("wikidata"),
-                    )
+                extratags: MutableMapping[str, Any] = osm_details_dict.get("extratags") or {}
+                wikidata_id: str | None = extratags.get("wikidata")
+                if wikidata_id is not None:
+                    self._set_attr(ATTR_WIKIDATA_ID, wikidata_id)
 
                 self._set_attr(ATTR_WIKIDATA_DICT, {})
                 if not self._is_attr_blank(ATTR_WIKIDATA_ID):
-                    wikidata_url: str = f"https://www.wikidata.org/wiki/Special:EntityData/{
-                        self._get_attr(ATTR_WIKIDATA_ID)
-                    }.json"
-                    await self._hass.async_add_executor_job(
-                        self._get_dict_from_url,
+                    wikidata_url: str = WIKIDATA_ENTITY_URL.format(
+                        wikidata_id=self._get_attr(ATTR_WIKIDATA_ID)
+                    )
+                    await self._async_get_dict_from_url(
                         wikidata_url,
                         "Wikidata",
                         ATTR_WIKIDATA_DICT,
                     )
 
     async def _async_fire_event_data(self, prev_last_place_name: str) -> None:
-        _LOGGER.debug("(%s) Building Event Data", self._get_attr(CONF_NAME))
-        event_data: MutableMapping[str, Any] = {}
-        if not self._is_attr_blank(CONF_NAME):
-            event_data.update({"entity": self._get_attr(CONF_NAME)})
-        if not self._is_attr_blank(ATTR_PREVIOUS_STATE):
-            event_data.update({"from_state": self._get_attr(ATTR_PREVIOUS_STATE)})
-        if not self._is_attr_blank(ATTR_NATIVE_VALUE):
-            event_data.update({"to_state": self._get_attr(ATTR_NATIVE_VALUE)})
-
-        for attr in EVENT_ATTRIBUTE_LIST:
-            if not self._is_attr_blank(attr):
-                event_data.update({attr: self._get_attr(attr)})
+        sensor_name: str | None = self._get_attr(CONF_NAME)
+        _LOGGER.debug("(%s) Building Event Data", sensor_name)
+        # _get_attr returns None only for blank attributes
+        event_data: MutableMapping[str, Any] = {
+            key: value
+            for key, attr in (
+                ("entity", CONF_NAME),
+                ("from_state", ATTR_PREVIOUS_STATE),
+                ("to_state", ATTR_NATIVE_VALUE),
+            )
+            if (value := self._get_attr(attr)) is not None
+        }
+        event_data.update(
+            {
+                attr: value
+                for attr in EVENT_ATTRIBUTE_LIST
+                if (value := self._get_attr(attr)) is not None
+            }
+        )
 
-        if (
-            not self._is_attr_blank(ATTR_LAST_PLACE_NAME)
-            and self._get_attr(ATTR_LAST_PLACE_NAME) != prev_last_place_name
-        ):
-            event_data.update({ATTR_LAST_PLACE_NAME: self._get_attr(ATTR_LAST_PLACE_NAME)})
+        last_place_name: Any = self._get_attr(ATTR_LAST_PLACE_NAME)
+        if last_place_name is not None and last_place_name != prev_last_place_name:
+            event_data[ATTR_LAST_PLACE_NAME] = last_place_name
 
         if self._get_attr(CONF_EXTENDED_ATTR):
-            for attr in EXTENDED_ATTRIBUTE_LIST:
-                if not self._is_attr_blank(attr):
-                    event_data.update({attr: self._get_attr(attr)})
+            event_data.update(
+                {
+                    attr: value
+                    for attr in EXTENDED_ATTRIBUTE_LIST
+                    if (value := self._get_attr(attr)) is not None
+                }
+            )
 
         self._hass.bus.fire(EVENT_TYPE, event_data)
         _LOGGER.debug(
             "(%s) Event Details [event_type: %s_state_update]: %s",
-            self._get_attr(CONF_NAME),
+            sensor_name,
             DOMAIN,
             event_data,
         )
-        _LOGGER.info(
-            "(%s) Event Fired [event_type: %s_state_update]", self._get_attr(CONF_NAME), DOMAIN
-        )
+        _LOGGER.info("(%s) Event Fired [event_type: %s_state_update]", sensor_name, DOMAIN)
 
-    def _write_sensor_to_json(self, name: str, filename: str) -> None:
-        sensor_attributes: MutableMapping[str, Any] = copy.deepcopy(self._internal_attr)
-        for k, v in sensor_attributes.items():
-            if isinstance(v, (datetime)):
-                # _LOGGER.debug("(%s) Removing Sensor Attribute: %s", self._get_attr(CONF_NAME), k)
-                sensor_attributes.pop(k)
+    @callback
+    def _async_save_sensor_to_json(self) -> None:
+        """Snapshot the attributes and write them to the JSON file after a short delay."""
+        self._json_attributes = {
+            k: v for k, v in self._internal_attr.items() if not isinstance(v, datetime)
+        }
+        if self._cancel_json_write is None:
+            self._cancel_json_write = async_call_later(
+                self._hass, JSON_WRITE_DELAY, self._async_write_sensor_to_json
+            )
+
+    async def _async_write_sensor_to_json(self, _now: datetime | None = None) -> None:
+        self._cancel_json_write = None
+        async with self._json_write_lock:
+            if self._json_file_removed:
+                return
+            await self._hass.async_add_executor_job(
+                self._write_sensor_to_json,
+                self._get_attr(CONF_NAME),
+                self._get_attr(ATTR_JSON_FILENAME),
+                self._json_attributes,
+            )
+
+    async def _async_flush_sensor_json(self, _event: Event | None = None) -> None:
+        """Write a pending JSON update now instead of waiting for the delay."""
+        if self._cancel_json_write is None:
+            return
+        self._cancel_json_write()
+        await self._async_write_sensor_to_json()
+
+    def _write_sensor_to_json(
+        self, name: str, filename: str, sensor_attributes: MutableMapping[str, Any]
+    ) -> None:
         # _LOGGER.debug("(%s) Sensor Attributes to Save: %s", self._get_attr(CONF_NAME), sensor_attributes)
+        json_data: bytes = json_bytes(sensor_attributes)
+        if json_data == self._json_written:
+            return
         try:
-            json_file_path: Path = Path(self._json_folder) / filename
-            with json_file_path.open("w") as jsonfile:
-                json.dump(sensor_attributes, jsonfile)
+            # Write to a temp file and rename so the file is never left half written
+            self._json_tmp_file_path.write_bytes(json_data)
+            self._json_tmp_file_path.replace(self._json_file_path)
+            self._json_written = json_data
         except OSError as e:
+            with suppress(OSError):
+                self._json_tmp_file_path.unlink(missing_ok=True)
             _LOGGER.debug(
                 "(%s) OSError writing sensor to JSON (%s): %s: %s",
                 name,
@@ -2103,120 +2044,107 @@ class Places(SensorEntity):
         )
 
     async def _async_update_coordinates_and_distance(self) -> int:
-        last_distance_traveled_m: float = self._get_attr_safe_float(ATTR_DISTANCE_FROM_HOME_M)
+        sensor_name: str | None = self._get_attr(CONF_NAME)
+        last_distance_from_home_m: float = self._get_attr_safe_float(ATTR_DISTANCE_FROM_HOME_M)
         proceed_with_update = 1
         # 0: False. 1: True. 2: False, but set direction of travel to stationary
 
-        if not self._is_attr_blank(ATTR_LATITUDE) and not self._is_attr_blank(ATTR_LONGITUDE):
-            self._set_attr(
-                ATTR_LOCATION_CURRENT,
-                f"{self._get_attr(ATTR_LATITUDE)},{self._get_attr(ATTR_LONGITUDE)}",
-            )
-        if not self._is_attr_blank(ATTR_LATITUDE_OLD) and not self._is_attr_blank(
-            ATTR_LONGITUDE_OLD
-        ):
-            self._set_attr(
-                ATTR_LOCATION_PREVIOUS,
-                f"{self._get_attr(ATTR_LATITUDE_OLD)},{self._get_attr(ATTR_LONGITUDE_OLD)}",
-            )
-        if not self._is_attr_blank(ATTR_HOME_LATITUDE) and not self._is_attr_blank(
-            ATTR_HOME_LONGITUDE
-        ):
-            self._set_attr(
-                ATTR_HOME_LOCATION,
-                f"{self._get_attr(ATTR_HOME_LATITUDE)},{self._get_attr(ATTR_HOME_LONGITUDE)}",
-            )
-
-        if (
-            not self._is_attr_blank(ATTR_LATITUDE)
-            and not self._is_attr_blank(ATTR_LONGITUDE)
-            and not self._is_attr_blank(ATTR_HOME_LATITUDE)
-            and not self._is_attr_blank(ATTR_HOME_LONGITUDE)
-        ):
-            self._set_attr(
-                ATTR_DISTANCE_FROM_HOME_M,
-                distance(
-                    float(self._get_attr_safe_str(ATTR_LATITUDE)),
-                    float(self._get_attr_safe_str(ATTR_LONGITUDE)),
-                    float(self._get_attr_safe_str(ATTR_HOME_LATITUDE)),
-                    float(self._get_attr_safe_str(ATTR_HOME_LONGITUDE)),
-                ),
-            )
-            if not self._is_attr_blank(ATTR_DISTANCE_FROM_HOME_M):
-                self._set_attr(
-                    ATTR_DISTANCE_FROM_HOME_KM,
-                    round(self._get_attr_safe_float(ATTR_DISTANCE_FROM_HOME_M) / 1000, 3),
-                )
+        # _get_attr returns None for blank coordinates
+        latitude: Any = self._get_attr(ATTR_LATITUDE)
+        longitude: Any = self._get_attr(ATTR_LONGITUDE)
+        latitude_old: Any = self._get_attr(ATTR_LATITUDE_OLD)
+        longitude_old: Any = self._get_attr(ATTR_LONGITUDE_OLD)
+        home_latitude: Any = self._get_attr(ATTR_HOME_LATITUDE)
+        home_longitude: Any = self._get_attr(ATTR_HOME_LONGITUDE)
+        has_current: bool = latitude is not None and longitude is not None
+        has_old: bool = latitude_old is not None and longitude_old is not None
+        has_home: bool = home_latitude is not None and home_longitude is not None
+
+        if has_current:
+            self._set_attr(ATTR_LOCATION_CURRENT, f"{latitude},{longitude}")
+        if has_old:
+            self._set_attr(ATTR_LOCATION_PREVIOUS, f"{latitude_old},{longitude_old}")
+        if has_home:
+            self._set_attr(ATTR_HOME_LOCATION, f"{home_latitude},{home_longitude}")
+
+        if has_current and self._home_coordinates is not None:
+            # Both distances are measured from the current location
+            current_latitude: float = float(latitude)
+            current_longitude: float = float(longitude)
+            distance_from_home_m: float | None = distance(
+                current_latitude,
+                current_longitude,
+                *self._home_coordinates,
+            )
+            self._set_attr(ATTR_DISTANCE_FROM_HOME_M, distance_from_home_m)
+            if distance_from_home_m is not None:
+                self._set_attr(ATTR_DISTANCE_FROM_HOME_KM, round(distance_from_home_m / 1000, 3))
                 self._set_attr(
                     ATTR_DISTANCE_FROM_HOME_MI,
-                    round(self._get_attr_safe_float(ATTR_DISTANCE_FROM_HOME_M) / 1609, 3),
+                    round(distance_from_home_m / METERS_PER_MILE, 3),
                 )
-
-            if not self._is_attr_blank(ATTR_LATITUDE_OLD) and not self._is_attr_blank(
-                ATTR_LONGITUDE_OLD
-            ):
-                self._set_attr(
-                    ATTR_DISTANCE_TRAVELED_M,
-                    distance(
-                        float(self._get_attr_safe_str(ATTR_LATITUDE)),
-                        float(self._get_attr_safe_str(ATTR_LONGITUDE)),
-                        float(self._get_attr_safe_str(ATTR_LATITUDE_OLD)),
-                        float(self._get_attr_safe_str(ATTR_LONGITUDE_OLD)),
-                    ),
+            else:
+                distance_from_home_m = 0.0
+
+            if has_old:
+                distance_traveled_m: float | None = distance(
+                    current_latitude,
+                    current_longitude,
+                    float(latitude_old),
+                    float(longitude_old),
                 )
-                if not self._is_attr_blank(ATTR_DISTANCE_TRAVELED_M):
+                self._set_attr(ATTR_DISTANCE_TRAVELED_M, distance_traveled_m)
+                if distance_traveled_m is not None:
                     self._set_attr(
                         ATTR_DISTANCE_TRAVELED_MI,
-                        round(
-                            self._get_attr_safe_float(ATTR_DISTANCE_TRAVELED_M) / 1609,
-                            3,
-                        ),
+                        round(distance_traveled_m / METERS_PER_MILE, 3),
                     )
 
-                if last_distance_traveled_m > self._get_attr_safe_float(ATTR_DISTANCE_FROM_HOME_M):
-                    self._set_attr(ATTR_DIRECTION_OF_TRAVEL, "towards home")
-                elif last_distance_traveled_m < self._get_attr_safe_float(
-                    ATTR_DISTANCE_FROM_HOME_M
-                ):
-                    self._set_attr(ATTR_DIRECTION_OF_TRAVEL, "away from home")
+                if last_distance_from_home_m > distance_from_home_m:
+                    direction_of_travel: str = "towards home"
+                elif last_distance_from_home_m < distance_from_home_m:
+                    direction_of_travel = "away from home"
                 else:
-                    self._set_attr(ATTR_DIRECTION_OF_TRAVEL, "stationary")
+                    direction_of_travel = "stationary"
             else:
-                self._set_attr(ATTR_DIRECTION_OF_TRAVEL, "stationary")
+                direction_of_travel = "stationary"
                 self._set_attr(ATTR_DISTANCE_TRAVELED_M, 0)
                 self._set_attr(ATTR_DISTANCE_TRAVELED_MI, 0)
+            self._set_attr(ATTR_DIRECTION_OF_TRAVEL, direction_of_travel)
 
-            _LOGGER.debug(
-                "(%s) Previous Location: %s",
-                self._get_attr(CONF_NAME),
-                self._get_attr(ATTR_LOCATION_PREVIOUS),
-            )
-            _LOGGER.debug(
-                "(%s) Current Location: %s",
-                self._get_attr(CONF_NAME),
-                self._get_attr(ATTR_LOCATION_CURRENT),
-            )
-            _LOGGER.debug(
-                "(%s) Home Location: %s",
-                self._get_attr(CONF_NAME),
-                self._get_attr(ATTR_HOME_LOCATION),
-            )
-            _LOGGER.info(
-                "(%s) Distance from home [%s]: %s km",
-                self._get_attr(CONF_NAME),
-                self._get_attr_safe_str(CONF_HOME_ZONE).split(".")[1],
-                self._get_attr(ATTR_DISTANCE_FROM_HOME_KM),
-            )
-            _LOGGER.info(
-                "(%s) Travel Direction: %s",
-                self._get_attr(CONF_NAME),
-                self._get_attr(ATTR_DIRECTION_OF_TRAVEL),
-            )
-            _LOGGER.info(
-                "(%s) Meters traveled since last update: %s",
-                self._get_attr(CONF_NAME),
-                round(self._get_attr_safe_float(ATTR_DISTANCE_TRAVELED_M), 1),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "(%s) Previous Location: %s",
+                    sensor_name,
+                    self._get_attr(ATTR_LOCATION_PREVIOUS),
+                )
+                _LOGGER.debug(
+                    "(%s) Current Location: %s",
+                    sensor_name,
+                    self._get_attr(ATTR_LOCATION_CURRENT),
+                )
+                _LOGGER.debug(
+                    "(%s) Home Location: %s",
+                    sensor_name,
+                    self._get_attr(ATTR_HOME_LOCATION),
+                )
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "(%s) Distance from home [%s]: %s km",
+                    sensor_name,
+                    self._home_zone_name,
+                    self._get_attr(ATTR_DISTANCE_FROM_HOME_KM),
+                )
+                _LOGGER.info(
+                    "(%s) Travel Direction: %s",
+                    sensor_name,
+                    direction_of_travel,
+                )
+                _LOGGER.info(
+                    "(%s) Meters traveled since last update: %s",
+                    sensor_name,
+                    round(self._get_attr_safe_float(ATTR_DISTANCE_TRAVELED_M), 1),
+                )
         else:
             proceed_with_update = 0
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
@@ -2225,22 +2153,23 @@ class Places(SensorEntity):
                 "old_latitude=%s, old_longitude=%s, "
                 "new_latitude=%s, new_longitude=%s, "
                 "home_latitude=%s, home_longitude=%s",
-                self._get_attr(CONF_NAME),
-                self._get_attr(ATTR_LATITUDE_OLD),
-                self._get_attr(ATTR_LONGITUDE_OLD),
-                self._get_attr(ATTR_LATITUDE),
-                self._get_attr(ATTR_LONGITUDE),
-                self._get_attr(ATTR_HOME_LATITUDE),
-                self._get_attr(ATTR_HOME_LONGITUDE),
+                sensor_name,
+                latitude_old,
+                longitude_old,
+                latitude,
+                longitude,
+                home_latitude,
+                home_longitude,
             )
         return proceed_with_update
 
-    async def _async_finalize_last_place_name(self, prev_last_place_name: str) -> None:
+    def _finalize_last_place_name(self, prev_last_place_name: str) -> None:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         if self._get_attr(ATTR_INITIAL_UPDATE):
             self._set_attr(ATTR_LAST_PLACE_NAME, prev_last_place_name)
             _LOGGER.debug(
                 "(%s) Runnining initial update after load, using prior last_place_name",
-                self._get_attr(CONF_NAME),
+                sensor_name,
             )
         elif self._get_attr(ATTR_LAST_PLACE_NAME) == self._get_attr(
             ATTR_PLACE_NAME
@@ -2250,15 +2179,15 @@ class Places(SensorEntity):
             _LOGGER.debug(
                 "(%s) Initial last_place_name is same as new: place_name=%s or devicetracker_zone_name=%s, "
                 "keeping previous last_place_name",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 self._get_attr(ATTR_PLACE_NAME),
                 self._get_attr(ATTR_DEVICETRACKER_ZONE_NAME),
             )
         else:
-            _LOGGER.debug("(%s) Keeping initial last_place_name", self._get_attr(CONF_NAME))
+            _LOGGER.debug("(%s) Keeping initial last_place_name", sensor_name)
         _LOGGER.info(
             "(%s) last_place_name: %s",
-            self._get_attr(CONF_NAME),
+            sensor_name,
             self._get_attr(ATTR_LAST_PLACE_NAME),
         )
 
@@ -2271,10 +2200,14 @@ class Places(SensorEntity):
             self._get_attr(CONF_DEVICETRACKER_ID),
         )
 
+        self._in_zone_cache = None
         now: datetime = await self._get_current_time()
-        previous_attr: MutableMapping[str, Any] = copy.deepcopy(self._internal_attr)
+        now_iso: str = now.isoformat(sep=" ", timespec="seconds")
+        # Attribute values are replaced rather than mutated, so a shallow copy can be restored
+        previous_attr: MutableMapping[str, Any] = dict(self._internal_attr)
 
-        await self._update_entity_name_and_cleanup()
+        await self._async_check_for_updated_entity_name()
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         await self._update_previous_state()
         await self._update_old_coordinates()
         prev_last_place_name = self._get_attr_safe_str(ATTR_LAST_PLACE_NAME)
@@ -2286,57 +2219,58 @@ class Places(SensorEntity):
             proceed_with_update = await self._determine_update_criteria()
 
         if proceed_with_update == 1:
-            await self._process_osm_update(now=now)
+            await self._process_osm_update(now_iso=now_iso)
 
             if await self._should_update_state(now=now):
                 await self._handle_state_update(now=now, prev_last_place_name=prev_last_place_name)
             else:
                 _LOGGER.info(
                     "(%s) No entity update needed, Previous State = New State",
-                    self._get_attr(CONF_NAME),
+                    sensor_name,
                 )
-                await self._rollback_update(previous_attr, now, proceed_with_update)
+                await self._rollback_update(previous_attr, now, now_iso, proceed_with_update)
         else:
-            await self._rollback_update(previous_attr, now, proceed_with_update)
+            await self._rollback_update(previous_attr, now, now_iso, proceed_with_update)
 
-        self._set_attr(ATTR_LAST_UPDATED, now.isoformat(sep=" ", timespec="seconds"))
-        _LOGGER.info("(%s) End of Update", self._get_attr(CONF_NAME))
+        self._set_attr(ATTR_LAST_UPDATED, now_iso)
+        _LOGGER.info("(%s) End of Update", sensor_name)
 
     async def _should_update_state(self, now: datetime) -> bool:
-        prev_state: str = self._get_attr_safe_str(ATTR_PREVIOUS_STATE)
-        native_value: str = self._get_attr_safe_str(ATTR_NATIVE_VALUE)
-        tracker_zone: str = self._get_attr_safe_str(ATTR_DEVICETRACKER_ZONE)
-
         if (
-            (
-                not self._is_attr_blank(ATTR_PREVIOUS_STATE)
-                and not self._is_attr_blank(ATTR_NATIVE_VALUE)
-                and prev_state.lower().strip() != native_value.lower().strip()
-                and prev_state.replace(" ", "").lower().strip() != native_value.lower().strip()
-                and prev_state.lower().strip() != tracker_zone.lower().strip()
-            )
-            or self._is_attr_blank(ATTR_PREVIOUS_STATE)
+            self._is_attr_blank(ATTR_PREVIOUS_STATE)
             or self._is_attr_blank(ATTR_NATIVE_VALUE)
             or self._get_attr(ATTR_INITIAL_UPDATE)
         ):
             return True
-        return False
+        prev_state: str = self._get_attr_safe_str(ATTR_PREVIOUS_STATE).lower().strip()
+        native_value: str = self._get_attr_safe_str(ATTR_NATIVE_VALUE).lower().strip()
+        tracker_zone: str = self._get_attr_safe_str(ATTR_DEVICETRACKER_ZONE).lower().strip()
+        return (
+            prev_state != native_value
+            and prev_state.replace(" ", "") != native_value
+            and prev_state != tracker_zone
+        )
 
     async def _handle_state_update(self, now: datetime, prev_last_place_name: str) -> None:
         if self._get_attr(CONF_EXTENDED_ATTR):
             await self._async_get_extended_attr()
         self._set_attr(ATTR_SHOW_DATE, False)
-        await self._async_cleanup_attributes()
 
         if not self._is_attr_blank(ATTR_NATIVE_VALUE):
             current_time: str = f"{now.hour:02}:{now.minute:02}"
             if self._get_attr(CONF_SHOW_TIME):
-                state: str = await Places._async_clear_since_from_state(
+                state: str = Places._clear_since_from_state(
                     self._get_attr_safe_str(ATTR_NATIVE_VALUE)
                 )
-                self._set_attr(ATTR_NATIVE_VALUE, f"{state[: 255 - 14]} (since {current_time})")
+                since: str = f" (since {current_time})"
+                self._set_attr(
+                    ATTR_NATIVE_VALUE, f"{state[: MAX_LENGTH_STATE_STATE - len(since)]}{since}"
+                )
             else:
-                self._set_attr(ATTR_NATIVE_VALUE, self._get_attr_safe_str(ATTR_NATIVE_VALUE)[:255])
+                self._set_attr(
+                    ATTR_NATIVE_VALUE,
+                    self._get_attr_safe_str(ATTR_NATIVE_VALUE)[:MAX_LENGTH_STATE_STATE],
+                )
             _LOGGER.info(
                 "(%s) New State: %s",
                 self._get_attr(CONF_NAME),
@@ -2353,14 +2287,14 @@ class Places(SensorEntity):
 
         await self._async_fire_event_data(prev_last_place_name=prev_last_place_name)
         self._set_attr(ATTR_INITIAL_UPDATE, False)
-        await self._hass.async_add_executor_job(
-            self._write_sensor_to_json,
-            self._get_attr(CONF_NAME),
-            self._get_attr(ATTR_JSON_FILENAME),
-        )
+        self._async_save_sensor_to_json()
 
     async def _rollback_update(
-        self, previous_attr: MutableMapping[str, Any], now: datetime, proceed_with_update: int
+        self,
+        previous_attr: MutableMapping[str, Any],
+        now: datetime,
+        now_iso: str,
+        proceed_with_update: int,
     ) -> None:
         self._internal_attr = previous_attr
         _LOGGER.debug(
@@ -2372,7 +2306,9 @@ class Places(SensorEntity):
             and self._get_attr(ATTR_DIRECTION_OF_TRAVEL) != "stationary"
             and changed_diff_sec >= 60
         ):
-            await self._async_change_dot_to_stationary(now=now, changed_diff_sec=changed_diff_sec)
+            await self._async_change_dot_to_stationary(
+                now_iso=now_iso, changed_diff_sec=changed_diff_sec
+            )
         if (
             self._get_attr(CONF_SHOW_TIME)
             and changed_diff_sec >= 86399
@@ -2381,19 +2317,18 @@ class Places(SensorEntity):
             await self._async_change_show_time_to_date()
 
     async def _get_current_time(self) -> datetime:
-        if self._hass.config.time_zone:
-            return datetime.now(tz=ZoneInfo(str(self._hass.config.time_zone)))
-        return datetime.now()
-
-    async def _update_entity_name_and_cleanup(self) -> None:
-        await self._async_check_for_updated_entity_name()
-        await self._async_cleanup_attributes()
+        time_zone: str | None = self._hass.config.time_zone
+        if not time_zone:
+            return datetime.now()
+        if self._time_zone is None or self._time_zone.key != str(time_zone):
+            self._time_zone = ZoneInfo(str(time_zone))
+        return datetime.now(tz=self._time_zone)
 
     async def _update_previous_state(self) -> None:
         if not self._is_attr_blank(ATTR_NATIVE_VALUE) and self._get_attr(CONF_SHOW_TIME):
             self._set_attr(
                 ATTR_PREVIOUS_STATE,
-                await Places._async_clear_since_from_state(
+                Places._clear_since_from_state(
                     orig_state=self._get_attr_safe_str(ATTR_NATIVE_VALUE)
                 ),
             )
@@ -2425,10 +2360,12 @@ class Places(SensorEntity):
 
     async def _update_coordinates(self) -> None:
         device_tracker = self._hass.states.get(self._get_attr(CONF_DEVICETRACKER_ID))
-        if _is_float(device_tracker.attributes.get(CONF_LATITUDE)):
-            self._set_attr(ATTR_LATITUDE, str(device_tracker.attributes.get(CONF_LATITUDE)))
-        if _is_float(device_tracker.attributes.get(CONF_LONGITUDE)):
-            self._set_attr(ATTR_LONGITUDE, str(device_tracker.attributes.get(CONF_LONGITUDE)))
+        latitude: Any = device_tracker.attributes.get(CONF_LATITUDE)
+        longitude: Any = device_tracker.attributes.get(CONF_LONGITUDE)
+        if _is_float(latitude):
+            self._set_attr(ATTR_LATITUDE, str(latitude))
+        if _is_float(longitude):
+            self._set_attr(ATTR_LONGITUDE, str(longitude))
 
     async def _determine_update_criteria(self) -> int:
         await self._async_get_initial_last_place_name()
@@ -2448,7 +2385,7 @@ class Places(SensorEntity):
             )
         return proceed_with_update
 
-    async def _process_osm_update(self, now: datetime) -> None:
+    async def _process_osm_update(self, now_iso: str) -> None:
         _LOGGER.info(
             "(%s) Meets criteria, proceeding with OpenStreetMap query",
             self._get_attr(CONF_NAME),
@@ -2459,29 +2396,25 @@ class Places(SensorEntity):
             self._get_attr(ATTR_DEVICETRACKER_ZONE),
         )
 
-        await self._async_reset_attributes()
+        self._reset_attributes()
         await self._async_get_map_link()
-        await self._query_osm_and_finalize(now=now)
+        await self._query_osm_and_finalize(now_iso=now_iso)
 
-    async def _query_osm_and_finalize(self, now: datetime) -> None:
-        osm_url: str = await self._build_osm_url()
-        await self._hass.async_add_executor_job(
-            self._get_dict_from_url, osm_url, "OpenStreetMaps", ATTR_OSM_DICT
-        )
+    async def _query_osm_and_finalize(self, now_iso: str) -> None:
+        await self._async_get_osm_dict()
         if not self._is_attr_blank(ATTR_OSM_DICT):
             await self._async_parse_osm_dict()
-            await self._async_finalize_last_place_name(
-                self._get_attr_safe_str(ATTR_LAST_PLACE_NAME)
-            )
+            self._finalize_last_place_name(self._get_attr_safe_str(ATTR_LAST_PLACE_NAME))
             await self._process_display_options()
-            self._set_attr(ATTR_LAST_CHANGED, now.isoformat(sep=" ", timespec="seconds"))
+            self._set_attr(ATTR_LAST_CHANGED, now_iso)
 
     async def _process_display_options(self) -> None:
+        sensor_name: str | None = self._get_attr(CONF_NAME)
         display_options: list[str] = []
         if not self._is_attr_blank(ATTR_DISPLAY_OPTIONS):
-            options_array: list[str] = self._get_attr_safe_str(ATTR_DISPLAY_OPTIONS).split(",")
-            for option in options_array:
-                display_options.extend([option.strip()])
+            display_options = list(
+                map(str.strip, self._get_attr_safe_str(ATTR_DISPLAY_OPTIONS).split(","))
+            )
         self._set_attr(ATTR_DISPLAY_OPTIONS_LIST, display_options)
 
         await self._async_get_driving_status()
@@ -2494,13 +2427,11 @@ class Places(SensorEntity):
             )
             _LOGGER.debug(
                 "(%s) New State using formatted_place: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 self._get_attr(ATTR_NATIVE_VALUE),
             )
 
-        elif any(
-            ext in (self._get_attr_safe_str(ATTR_DISPLAY_OPTIONS)) for ext in ["(", ")", "[", "]"]
-        ):
+        elif ADV_OPTIONS_RE.search(self._get_attr_safe_str(ATTR_DISPLAY_OPTIONS)):
             self._clear_attr(ATTR_DISPLAY_OPTIONS_LIST)
             display_options = []
             self._adv_options_state_list = []
@@ -2509,7 +2440,7 @@ class Places(SensorEntity):
             self._temp_i = 0
             _LOGGER.debug(
                 "(%s) Initial Advanced Display Options: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 self._get_attr(ATTR_DISPLAY_OPTIONS),
             )
 
@@ -2518,7 +2449,7 @@ class Places(SensorEntity):
             )
             _LOGGER.debug(
                 "(%s) Back from initial advanced build: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 self._adv_options_state_list,
             )
             await self._async_compile_state_from_advanced_options()
@@ -2533,7 +2464,7 @@ class Places(SensorEntity):
             )
             _LOGGER.debug(
                 "(%s) New State from Tracked Entity Zone: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 self._get_attr(ATTR_NATIVE_VALUE),
             )
         elif not self._is_attr_blank(ATTR_DEVICETRACKER_ZONE_NAME):
@@ -2543,27 +2474,50 @@ class Places(SensorEntity):
             )
             _LOGGER.debug(
                 "(%s) New State from Tracked Entity Zone Name: %s",
-                self._get_attr(CONF_NAME),
+                sensor_name,
                 self._get_attr(ATTR_NATIVE_VALUE),
             )
 
+    async def _async_get_osm_dict(self) -> None:
+        """Set the OSM dict from the cache if recently looked up nearby, otherwise query OSM."""
+        cache_key: tuple[float, float] | None = None
+        if self._get_attr(CONF_USE_OSM_CACHE):
+            cache_key = (
+                round(float(self._get_attr_safe_str(ATTR_LATITUDE)), OSM_CACHE_PRECISION),
+                round(float(self._get_attr_safe_str(ATTR_LONGITUDE)), OSM_CACHE_PRECISION),
+            )
+            cached = self._osm_cache.pop(cache_key, None)
+            if cached is not None and time.monotonic() - cached[0] < OSM_CACHE_TTL:
+                _LOGGER.debug(
+                    "(%s) Using cached OpenStreetMaps data for %s",
+                    self._get_attr(CONF_NAME),
+                    cache_key,
+                )
+                # Re-insert to mark as most recently used
+                self._osm_cache[cache_key] = cached
+                self._set_attr(ATTR_OSM_DICT, cached[1])
+                return
+
+        osm_url: str = await self._build_osm_url()
+        await self._async_get_dict_from_url(osm_url, "OpenStreetMaps", ATTR_OSM_DICT)
+        if cache_key is not None and not self._is_attr_blank(ATTR_OSM_DICT):
+            self._osm_cache[cache_key] = (time.monotonic(), self._get_attr_safe_dict(ATTR_OSM_DICT))
+            while len(self._osm_cache) > OSM_CACHE_SIZE:
+                self._osm_cache.pop(next(iter(self._osm_cache)))
+
     async def _build_osm_url(self) -> str:
         """Build the OpenStreetMap query URL."""
-        base_url = "https://nominatim.openstreetmap.org/reverse?format=json"
-        lat: str = self._get_attr_safe_str(ATTR_LATITUDE)
-        lon: str = self._get_attr_safe_str(ATTR_LONGITUDE)
-        lang: str = self._get_attr_safe_str(CONF_LANGUAGE)
-        email: str = self._get_attr_safe_str(CONF_API_KEY)
-        return f"{base_url}&lat={lat}&lon={lon}&accept-language={lang}&addressdetails=1&namedetails=1&zoom=18&limit=1&email={email}"
-
-    async def _async_change_dot_to_stationary(self, now: datetime, changed_diff_sec: int) -> None:
+        osm_params: MutableMapping[str, Any] = {
+            **self._osm_reverse_params,
+            "lat": self._get_attr_safe_str(ATTR_LATITUDE),
+            "lon": self._get_attr_safe_str(ATTR_LONGITUDE),
+        }
+        return f"{OSM_REVERSE_URL}?{urlencode(osm_params)}"
+
+    async def _async_change_dot_to_stationary(self, now_iso: str, changed_diff_sec: int) -> None:
         self._set_attr(ATTR_DIRECTION_OF_TRAVEL, "stationary")
-        self._set_attr(ATTR_LAST_CHANGED, now.isoformat(sep=" ", timespec="seconds"))
-        await self._hass.async_add_executor_job(
-            self._write_sensor_to_json,
-            self._get_attr(CONF_NAME),
-            self._get_attr(ATTR_JSON_FILENAME),
-        )
+        self._set_attr(ATTR_LAST_CHANGED, now_iso)
+        self._async_save_sensor_to_json()
         _LOGGER.debug(
             "(%s) Updating direction of travel to stationary (Last changed %s seconds ago)",
             self._get_attr(CONF_NAME),
@@ -2572,18 +2526,16 @@ class Places(SensorEntity):
 
     async def _async_change_show_time_to_date(self) -> None:
         if not self._is_attr_blank(ATTR_NATIVE_VALUE) and self._get_attr(CONF_SHOW_TIME):
+            # ATTR_LAST_CHANGED is an ISO string (YYYY-MM-DD HH:MM:SS)
+            last_changed: str = self._get_attr_safe_str(ATTR_LAST_CHANGED)
             if self._get_attr(CONF_DATE_FORMAT) == "dd/mm":
-                dateformat = "%d/%m"
+                mmddstring: str = f"{last_changed[8:10]}/{last_changed[5:7]}"
             else:
-                dateformat = "%m/%d"
-            mmddstring: str = (
-                datetime.fromisoformat(self._get_attr_safe_str(ATTR_LAST_CHANGED))
-                .strftime(f"{dateformat}")
-                .replace(" ", "")[:5]
-            )
+                mmddstring = f"{last_changed[5:7]}/{last_changed[8:10]}"
+            state: str = Places._clear_since_from_state(self._get_attr_safe_str(ATTR_NATIVE_VALUE))
+            since: str = f" (since {mmddstring})"
             self._set_attr(
-                ATTR_NATIVE_VALUE,
-                f"{await Places._async_clear_since_from_state(self._get_attr_safe_str(ATTR_NATIVE_VALUE))} (since {mmddstring})",
+                ATTR_NATIVE_VALUE, f"{state[: MAX_LENGTH_STATE_STATE - len(since)]}{since}"
             )
 
             if not self._is_attr_blank(ATTR_NATIVE_VALUE):
@@ -2591,11 +2543,7 @@ class Places(SensorEntity):
             else:
                 self._attr_native_value = None
             self._set_attr(ATTR_SHOW_DATE, True)
-            await self._hass.async_add_executor_job(
-                self._write_sensor_to_json,
-                self._get_attr(CONF_NAME),
-                self._get_attr(ATTR_JSON_FILENAME),
-            )
+            self._async_save_sensor_to_json()
             _LOGGER.debug(
                 "(%s) Updating state to show date instead of time since last change",
                 self._get_attr(CONF_NAME),
@@ -2607,14 +2555,21 @@ class Places(SensorEntity):
     async def _async_get_seconds_from_last_change(self, now: datetime) -> int:
         if self._is_attr_blank(ATTR_LAST_CHANGED):
             return 3600
+        last_changed_str: str = self._get_attr_safe_str(ATTR_LAST_CHANGED)
         try:
-            last_changed: datetime = datetime.fromisoformat(
-                self._get_attr_safe_str(ATTR_LAST_CHANGED)
-            )
+            # last_changed only changes when the place changes, so reuse the parsed value
+            if (
+                self._last_changed_cache is not None
+                and self._last_changed_cache[0] == last_changed_str
+            ):
+                last_changed: datetime = self._last_changed_cache[1]
+            else:
+                last_changed = datetime.fromisoformat(last_changed_str)
+                self._last_changed_cache = (last_changed_str, last_changed)
         except (TypeError, ValueError) as e:
             _LOGGER.warning(
                 "Error converting Last Changed date/time (%s) into datetime: %r",
-                self._get_attr(ATTR_LAST_CHANGED),
+                last_changed_str,
                 e,
             )
             return 3600
@@ -2634,11 +2589,10 @@ class Places(SensorEntity):
                 return 3600
             return int(changed_diff_sec)
 
-    async def _async_reset_attributes(self) -> None:
+    def _reset_attributes(self) -> None:
         """Reset sensor attributes."""
         for attr in RESET_ATTRIBUTE_LIST:
             self._clear_attr(attr)
-        await self._async_cleanup_attributes()
 
 
 class PlacesNoRecorder(Places):